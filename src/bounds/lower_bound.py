@@ -34,18 +34,9 @@ class LowerBoundCalculator:
             float: The calculated lower bound.
 
         """
-        node_ids = [int(x) for x in node_manager.all_node_ids()]
-        n = len(node_ids)
-        max_distance = 0.0  # Initialize max distance
-        min_distance = float("inf")  # Initialize min distance
-        for i in range(n):
-            for j in range(i + 1, n):
-                node1 = node_manager.get_node(node_ids[i])
-                node2 = node_manager.get_node(node_ids[j])
-                if node1 and node2:
-                    distance = distance_manager.get_distance(node1, node2)
-                    min_distance = min(min_distance, distance)  # Update min distance
-                    max_distance = max(max_distance, distance)  # Update max distance
+        n = len(node_manager.nodes)
+        min_distance = distance_manager.min_distance()
+        max_distance = distance_manager.max_distance()
         self.logger.debug(f"Minimum distance between any two nodes: {min_distance}")
         self.logger.debug(f"Maximum distance between any two nodes: {max_distance}")
         self.logger.debug(f"Total number of nodes (n): {n}")
@@ -34,17 +34,8 @@ class UpperBoundCalculator:
             float: The calculated upper bound.
 
         """
-
-        node_ids = [int(x) for x in node_manager.all_node_ids()]
-        n = len(node_ids)
-        max_distance = 0.0  # Initialize max distance
-        for i in range(n):
-            for j in range(i + 1, n):
-                node1 = node_manager.get_node(node_ids[i])
-                node2 = node_manager.get_node(node_ids[j])
-                if node1 and node2:
-                    distance = distance_manager.get_distance(node1, node2)
-                    max_distance = max(max_distance, distance)  # Update max distance
+        n = len(node_manager.nodes)
+        max_distance = distance_manager.max_distance()
         self.logger.debug(f"Maximum distance between any two nodes: {max_distance}")
         self.logger.debug(f"Total number of nodes (n): {n}")
         upper_bound = max_distance * n * (max_distance + 1)
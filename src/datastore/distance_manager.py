@@ -1,23 +1,148 @@
+import hashlib
+import math
+from pathlib import Path
+
+import numpy as np
+from numba import njit, prange
+
 from schemas.node import Node
 from utils.logger import Logger
 
+PRECISION_DIGITS = 1
+
+
+@njit(cache=True, fastmath=True)
+def _euclid2d(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Euclidian distance kernel specialised for two dimensions."""
+    dx = x1 - x2
+    dy = y1 - y2
+    return math.sqrt(dx * dx + dy * dy)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _pairwise_euclid2d(coords: np.ndarray) -> np.ndarray:
+    """Compute the N x N Euclidian distance matrix, one row per thread.
+
+    Only the upper triangle is computed and mirrored into the lower one.
+    """
+    nb_of_nodes = coords.shape[0]
+    distances = np.zeros((nb_of_nodes, nb_of_nodes), dtype=np.float64)
+    for i in prange(nb_of_nodes):
+        for j in range(i + 1, nb_of_nodes):
+            distance = _euclid2d(coords[i, 0], coords[i, 1], coords[j, 0], coords[j, 1])
+            distances[i, j] = distance
+            distances[j, i] = distance
+    return distances
+
+
+@njit(cache=True, parallel=True)
+def _condense(distance_matrix: np.ndarray) -> np.ndarray:
+    """Pack the upper triangle of a symmetric matrix into a flat array, row by row.
+
+    Pair (i, j), i < j, lands at index N*i - i*(i+1)/2 + j - i - 1.
+    """
+    nb_of_nodes = distance_matrix.shape[0]
+    condensed = np.empty(nb_of_nodes * (nb_of_nodes - 1) // 2, dtype=distance_matrix.dtype)
+    for i in prange(nb_of_nodes):
+        offset = nb_of_nodes * i - i * (i + 1) // 2 - i - 1
+        for j in range(i + 1, nb_of_nodes):
+            condensed[offset + j] = distance_matrix[i, j]
+    return condensed
+
+
+@njit(cache=True, parallel=True)
+def _expand(condensed: np.ndarray, nb_of_nodes: int) -> np.ndarray:
+    """Unpack a flat upper triangle (see `_condense`) into a symmetric matrix."""
+    distance_matrix = np.zeros((nb_of_nodes, nb_of_nodes), dtype=condensed.dtype)
+    for i in prange(nb_of_nodes):
+        offset = nb_of_nodes * i - i * (i + 1) // 2 - i - 1
+        for j in range(i + 1, nb_of_nodes):
+            distance_matrix[i, j] = condensed[offset + j]
+            distance_matrix[j, i] = condensed[offset + j]
+    return distance_matrix
+
 
 class EuclidianDistanceManager:
-    """A manager for calculating Euclidian distances between nodes."""
+    """A manager for calculating Euclidian distances between nodes.
+
+    All pairwise distances are precomputed once into a dense matrix.
+    Node IDs double as row/column indices, see `NodeManager.coords`.
+    """
 
     logger: Logger
-    distances: dict[tuple[int, int], float]
+    coords: np.ndarray
+    distance_matrix: np.ndarray
+    _max_distance: float | None
+    _min_distance: float | None
 
     def __init__(
             self,
-            nb_of_nodes: int,
+            coords: np.ndarray,
             logger: Logger | None = None,
+            cache_dir: Path | str | None = None,
         ) -> None:
-        """Initialize the distance manager."""
+        """Initialize the distance manager and precompute the distance matrix.
+
+        Args:
+            coords: (N, 2) array of node coordinates, row i holds node i
+            logger: Logger instance
+            cache_dir: Directory to persist the distance matrix in, for reuse across runs
+                with the same coordinates (None to disable)
+
+        """
         self.logger = logger or Logger(__name__)
-        self.distances = {
-            (nb_of_nodes - 1, 0): 0.0,  # distance from last node to depot is zero
-        }
+        self.coords = coords
+        if cache_dir is None:
+            self.distance_matrix = self._build_distance_matrix(coords)
+        else:
+            self.distance_matrix = self._load_or_build_distance_matrix(coords, Path(cache_dir))
+        self._max_distance = None
+        self._min_distance = None
+        self.logger.debug(f"Precomputed {len(coords)}x{len(coords)} distance matrix.")
+
+    @staticmethod
+    def _build_distance_matrix(coords: np.ndarray) -> np.ndarray:
+        """Build the rounded N x N distance matrix, kept float64 so rounded values read back exactly."""
+        distances = _pairwise_euclid2d(np.ascontiguousarray(coords, dtype=np.float64))
+        return np.round(distances, PRECISION_DIGITS, out=distances)
+
+    def _load_or_build_distance_matrix(self, coords: np.ndarray, cache_dir: Path) -> np.ndarray:
+        """Load a cached distance matrix, or build and cache it.
+
+        The cache key hashes the coordinates and the rounding precision,
+        so a changed input never hits a stale matrix. Only the float64 upper
+        triangle is stored, which halves the file size. Loading reads it whole
+        and expands it into a square matrix in RAM, as every lookup indexes
+        the square matrix; it saves the distance computation, not memory.
+        """
+        coords = np.ascontiguousarray(coords, dtype=np.float64)
+        key = hashlib.sha1(coords.tobytes(), usedforsecurity=False)
+        key.update(f"{coords.shape}:{PRECISION_DIGITS}:condensed:float64".encode())
+        filepath = cache_dir / f"distances_{key.hexdigest()[:16]}.npy"
+        if filepath.exists():
+            self.logger.info(f"Loading cached distance matrix from {filepath}")
+            return _expand(np.load(filepath), len(coords))
+
+        distance_matrix = self._build_distance_matrix(coords)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = filepath.with_suffix(".tmp.npy")
+        np.save(tmp_filepath, _condense(distance_matrix))
+        tmp_filepath.replace(filepath)  # atomic, readers never see a partial file
+        self.logger.info(f"Cached distance matrix to {filepath}")
+        return distance_matrix
+
+    def max_distance(self) -> float:
+        """Get the largest distance between any two nodes (computed once)."""
+        if self._max_distance is None:
+            self._max_distance = float(self.distance_matrix.max()) if self.distance_matrix.size else 0.0
+        return self._max_distance
+
+    def min_distance(self) -> float:
+        """Get the smallest distance between two distinct nodes (computed once), inf if there are none."""
+        if self._min_distance is None:
+            condensed = _condense(self.distance_matrix)
+            self._min_distance = float(condensed.min()) if condensed.size else float("inf")
+        return self._min_distance
 
     def get_distance(
             self,
@@ -28,29 +153,34 @@ class EuclidianDistanceManager:
 
         Assumes undirected distances (distance from A to B is the same as from B to A).
         """
+        return float(self.distance_matrix[node1.id, node2.id])
 
-        min_id = min(node1.id, node2.id)
-        if min_id == node1.id:
-            node_min_id = node1
-            node_max_id = node2
-        else:
-            node_min_id = node2
-            node_max_id = node1
-        key = (node_min_id.id, node_max_id.id)
-        if key not in self.distances:
-            distance = self.calculate_distance(node_min_id, node_max_id)
-            self.distances[key] = distance
-            self.logger.debug(f"Calculated distance between {node1.id} and {node2.id}: {distance}")
-        return self.distances[key]
+    def get_distances_many(
+            self,
+            source: Node,
+            target_ids: np.ndarray | None = None,
+        ) -> np.ndarray:
+        """Get the Euclidian distances from a node to many nodes at once.
+
+        Args:
+            source: The node to measure from
+            target_ids: IDs of the nodes to measure to (None for all nodes, in ID order)
+
+        Returns:
+            The distances, in the order of `target_ids`
+
+        """
+        if target_ids is None:
+            return self.distance_matrix[source.id]
+        return self.distance_matrix[source.id, target_ids]
 
     @staticmethod
     def calculate_distance(
             node1: Node,
             node2: Node,
-            precition_digits: int = 1,
         ) -> float:
-        """Calculate the Euclidian distance between two nodes."""
-        if node1.id == node2.id:
-            return 0.0
-        distance = ((node1.x - node2.x) ** 2 + (node1.y - node2.y) ** 2) ** 0.5
-        return round(distance, precition_digits)
+        """Calculate the unrounded Euclidian distance between two nodes.
+
+        Rounding to `PRECISION_DIGITS` is applied once, to the whole distance matrix.
+        """
+        return _euclid2d(node1.x, node1.y, node2.x, node2.y)
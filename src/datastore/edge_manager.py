@@ -1,3 +1,5 @@
+import numpy as np
+
 from schemas.node import Node
 from utils.logger import Logger
 from datastore.distance_manager import EuclidianDistanceManager
@@ -10,10 +12,11 @@ class EdgeManager:
     """
 
     logger: Logger
-    nodes: dict[str, Node] = {}
+    nodes: dict[int, Node] = {}
     edges: dict[tuple[str, str], bool] = {}
     respect_even_to_odd_travel_constraint: bool
     respect_odd_to_even_travel_constraint: bool
+    _valid_edges: np.ndarray | None
 
     def __init__(
             self,
@@ -27,10 +30,37 @@ class EdgeManager:
         self.nodes = {}
         self.respect_even_to_odd_travel_constraint = respect_even_to_odd_travel_constraint
         self.respect_odd_to_even_travel_constraint = respect_odd_to_even_travel_constraint
+        self._valid_edges = None
 
     def add_node(self, node: Node) -> None:
         """Add a Node to the manager."""
         self.nodes[node.id] = node
+        self._valid_edges = None
+
+    def valid_edge_matrix(self) -> np.ndarray:
+        """Get `is_edge_valid` for every ordered pair of nodes as an (N, N) boolean array.
+
+        Node IDs double as row/column indices, i.e. IDs must be 0..N-1.
+        The matrix is computed once and cached until a node is added.
+        """
+        if self._valid_edges is not None:
+            return self._valid_edges
+
+        n = len(self.nodes)
+        node_from = np.arange(n)[:, np.newaxis]
+        node_to = np.arange(n)[np.newaxis, :]
+        valid_edges = np.ones((n, n), dtype=np.bool_)
+        if self.respect_even_to_odd_travel_constraint:
+            valid_edges &= ~((node_from % 2 == 0) & (node_to % 2 == 1) & (node_from < n / 2))
+        if self.respect_odd_to_even_travel_constraint:
+            valid_edges &= ~((node_from % 2 == 1) & (node_to % 2 == 0) & (node_from >= n / 2))
+        if n:
+            valid_edges[n - 1, :] = False  # Allow return to depot only from last node
+            valid_edges[:, 0] = True  # Allow leaving depot, and finishing at last node
+            valid_edges[0, :] = True
+
+        self._valid_edges = valid_edges
+        return valid_edges
 
     def is_edge_valid(self, node_from: Node, node_to: Node) -> bool:
         """Check if an edge between two nodes is valid."""
@@ -43,9 +73,9 @@ class EdgeManager:
             # traveling form node $𝑖 ∈ 𝑁  \ {0, 𝑛 + 1}$ to node $𝑗 ∈ 𝑁 \ {0, 𝑛 + 1}$ is forbidden
             # when: (i) $𝑖$ is an even number, (ii) $𝑗$ is an odd number, and (iii) $𝑖 < 𝑛/2$, and
             if (
-                int(node_from.id) % 2 == 0 and
-                int(node_to.id) % 2 == 1 and
-                int(node_from.id) < n / 2
+                node_from.id % 2 == 0 and
+                node_to.id % 2 == 1 and
+                node_from.id < n / 2
             ):
                 return False
         if self.respect_odd_to_even_travel_constraint:
@@ -53,23 +83,38 @@ class EdgeManager:
             # * traveling form node $𝑖 ∈ 𝑁 \ {0, 𝑛 + 1}$ to node $𝑗 ∈ 𝑁 \ {0, 𝑛 + 1}$ is forbidden
             # when: (i) $𝑖$ is an odd number, (ii) $𝑗$ is an even number, and (iii) $𝑖 ≥ 𝑛/2$
             if (
-                int(node_from.id) % 2 == 1 and
-                int(node_to.id) % 2 == 0 and
-                int(node_from.id) >= n / 2
+                node_from.id % 2 == 1 and
+                node_to.id % 2 == 0 and
+                node_from.id >= n / 2
             ):
                 return False
         return True
 
     def neighbors(
             self,
-            node_id: str,
+            node_id: int,
             *,
             candidates: list[Node] | None = None,
             max_neighbors: int | None = None,
             sort_by_distance: bool = False,
             distance_manager: EuclidianDistanceManager | None = None,
         ) -> list[Node]:
-        """Get all neighboring nodes for a given node ID."""
+        """Get all neighboring nodes for a given node ID.
+
+        Args:
+            node_id: ID of the node to get the neighbors of
+            candidates: Nodes to choose from, all nodes if None
+            max_neighbors: Maximum number of neighbors to return, all if None
+            sort_by_distance: If True, return the closest neighbors first
+            distance_manager: Manager holding the precomputed distances, required if sort_by_distance
+
+        Returns:
+            The nodes reachable from the node over a valid edge
+
+        """
+        if sort_by_distance and distance_manager is None:
+            msg = "A distance manager is required to sort the neighbors of a node by distance"
+            raise ValueError(msg)
         if node_id not in self.nodes:
             self.logger.warning(f"Node ID {node_id} not found in EdgeManager.")
             return []
@@ -89,11 +134,10 @@ class EdgeManager:
         candidates = [n for n in candidates if self.is_edge_valid(self.nodes[node_id], n)]
 
         if sort_by_distance:
-            distance_manager = distance_manager or EuclidianDistanceManager(logger=self.logger)
-            candidates.sort(
-                key=lambda node: distance_manager.get_distance(self.nodes[node_id], node),
-                reverse=False,  # closest first
-            )
+            candidate_ids = np.fromiter((node.id for node in candidates), dtype=np.int64, count=len(candidates))
+            distances = distance_manager.get_distances_many(self.nodes[node_id], candidate_ids)
+            # closest first, a stable sort keeps the candidate order between equal distances
+            candidates = [candidates[i] for i in np.argsort(distances, kind="stable").tolist()]
 
         if max_neighbors is not None:
             return candidates[:max_neighbors]
@@ -1,3 +1,5 @@
+import numpy as np
+
 from datastore.distance_manager import EuclidianDistanceManager
 from schemas.node import Node
 from utils.logger import Logger
@@ -7,7 +9,8 @@ class NodeManager:
     """A manager for Node objects."""
 
     logger: Logger
-    nodes: dict[str, Node] = {}
+    nodes: dict[int, Node] = {}
+    _coords: np.ndarray | None
 
     def __init__(
             self,
@@ -16,16 +19,33 @@ class NodeManager:
         """Initialize the node manager."""
         self.logger = logger or Logger(__name__)
         self.nodes = {}
+        self._coords = None
 
     def add_node(self, node: Node) -> None:
         """Add a Node to the manager."""
         self.nodes[node.id] = node
+        self._coords = None
 
-    def get_node(self, node_id: str) -> Node | None:
+    def load_bulk(
+            self,
+            node_ids: np.ndarray,
+            xs: np.ndarray,
+            ys: np.ndarray,
+        ) -> None:
+        """Add nodes from column arrays, filling the coordinate array directly."""
+        was_empty = not self.nodes
+        for node_id, x, y in zip(node_ids.tolist(), xs.tolist(), ys.tolist(), strict=True):
+            self.nodes[node_id] = Node(id=node_id, x=x, y=y)
+        self._coords = None
+        if was_empty and self._are_dense_ids(node_ids):
+            self._coords = np.empty((len(node_ids), 2), dtype=np.float64)
+            self._coords[node_ids] = np.column_stack((xs, ys))
+
+    def get_node(self, node_id: int) -> Node | None:
         """Retrieve a Node by its ID."""
         return self.nodes.get(node_id)
 
-    def all_node_ids(self) -> list[str]:
+    def all_node_ids(self) -> list[int]:
         """Get a list of all node IDs."""
         return list(self.nodes.keys())
 
@@ -33,15 +53,55 @@ class NodeManager:
         """Get a list of all nodes."""
         return list(self.nodes.values())
 
+    @property
+    def n(self) -> int:
+        """Get the number of intermediate nodes, i.e. excluding start (0) and end (n+1) depot."""
+        return len(self.nodes) - 2
+
+    def coords(self) -> np.ndarray:
+        """Get the node coordinates as an (N, 2) array, where row i holds node i."""
+        if self._coords is None:
+            self._coords = self.coords_of(self.all_nodes())
+        return self._coords
+
+    @staticmethod
+    def coords_of(nodes: list[Node]) -> np.ndarray:
+        """Pack node coordinates into an (N, 2) array indexed by node ID.
+
+        Node IDs double as row indices, i.e. IDs must be 0..N-1.
+        """
+        node_ids = np.fromiter((node.id for node in nodes), dtype=np.int64, count=len(nodes))
+        if not NodeManager._are_dense_ids(node_ids):
+            msg = "Node IDs must be the consecutive integers 0..N-1"
+            raise ValueError(msg)
+        coords = np.empty((len(nodes), 2), dtype=np.float64)
+        coords[node_ids, 0] = np.fromiter((node.x for node in nodes), dtype=np.float64, count=len(nodes))
+        coords[node_ids, 1] = np.fromiter((node.y for node in nodes), dtype=np.float64, count=len(nodes))
+        return coords
+
+    @staticmethod
+    def _are_dense_ids(node_ids: np.ndarray) -> bool:
+        """Check that the node IDs are a permutation of 0..N-1."""
+        return np.array_equal(np.sort(node_ids), np.arange(len(node_ids)))
+
     def get_closest_k_nodes(
             self,
             target_node: Node,
             k: int,
             distance_manager: EuclidianDistanceManager | None = None,
         ) -> list[Node]:
-        """Get the k closest nodes to the target node."""
-        sorted_nodes = sorted(
-            self.nodes.values(),
-            key=lambda node: distance_manager.get_distance(target_node, node) if distance_manager else float("inf"),
-        )
-        return sorted_nodes[1:k + 1]  # Exclude the target node itself
+        """Get the k closest nodes to the target node, closest first."""
+        if distance_manager:
+            distances = distance_manager.get_distances_many(target_node).astype(np.float64)
+        else:
+            # squared distances preserve the order, no square root needed
+            distances = ((self.coords() - self.coords()[target_node.id]) ** 2).sum(axis=1)
+        distances[target_node.id] = np.inf  # Exclude the target node itself
+
+        k = min(k, len(distances) - 1)
+        if k <= 0:
+            return []
+        # partition in O(N), then sort only the k selected
+        closest_ids = np.argpartition(distances, k - 1)[:k]
+        closest_ids = closest_ids[np.argsort(distances[closest_ids], kind="stable")]
+        return [self.nodes[int(node_id)] for node_id in closest_ids]
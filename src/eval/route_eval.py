@@ -1,4 +1,4 @@
-from functools import cache
+import numpy as np
 
 from datastore.distance_manager import EuclidianDistanceManager
 from datastore.edge_manager import EdgeManager
@@ -9,7 +9,6 @@ from utils.logger import Logger
 MIN_ROUTE_NODES = 2  # Including start and end depot nodes
 
 
-@cache
 def get_l_value(
     node_manager: NodeManager,
     distance_manager: EuclidianDistanceManager,
@@ -24,16 +23,7 @@ def get_l_value(
         The L value
 
     """
-    n = len(node_manager.nodes) - 2  # Excluding start (0) and end (n+1) depot
-
-    max_distance_matrix = 0.0
-    all_nodes = list(node_manager.nodes.values())
-    for i, node1 in enumerate(all_nodes):
-        for node2 in all_nodes[i + 1:]:
-            dist = distance_manager.get_distance(node1, node2)
-            max_distance_matrix = max(max_distance_matrix, dist)
-
-    return max_distance_matrix * n
+    return distance_manager.max_distance() * node_manager.n
 
 
 class RouteEvaluator:
@@ -43,6 +33,7 @@ class RouteEvaluator:
     node_manager: NodeManager
     edge_manager: EdgeManager
     distance_manager: EuclidianDistanceManager
+    _valid_transitions: np.ndarray | None
 
     def __init__(
             self,
@@ -56,27 +47,47 @@ class RouteEvaluator:
         self.node_manager = node_manager
         self.edge_manager = edge_manager
         self.distance_manager = distance_manager
+        self._valid_transitions = None
+
+    def valid_transition_matrix(self) -> np.ndarray:
+        """Get the sequence constraints of `is_valid_route` as an (N, N) boolean array.
+
+        Entry [i, j] tells if node j may directly follow node i. Transitions from
+        or to a depot node are always allowed, as `is_valid_route` checks those
+        by position instead. Node IDs double as row/column indices.
+        """
+        nb_of_nodes = len(self.node_manager.nodes)
+        if self._valid_transitions is not None and len(self._valid_transitions) == nb_of_nodes:
+            return self._valid_transitions
+
+        n = self.node_manager.n
+        current_ids = np.arange(nb_of_nodes)[:, np.newaxis]
+        next_ids = np.arange(nb_of_nodes)[np.newaxis, :]
+        even_to_odd = (current_ids % 2 == 0) & (next_ids % 2 == 1) & (current_ids < n / 2)
+        odd_to_even = (current_ids % 2 == 1) & (next_ids % 2 == 0) & (current_ids >= n / 2)
+        valid_transitions = ~(even_to_odd | odd_to_even)
+        if nb_of_nodes:
+            valid_transitions[[0, -1], :] = True
+            valid_transitions[:, [0, -1]] = True
+
+        self._valid_transitions = valid_transitions
+        return valid_transitions
 
     def total_distance_and_distances(
             self,
             route: Route,
-        ) -> tuple[float, list[float]]:
-        """Calculate the total distance of the route."""
+        ) -> tuple[float, np.ndarray]:
+        """Calculate the total distance of the route, and the distance of each of its edges.
 
-        if len(route.sequence) < MIN_ROUTE_NODES:
-            return 0.0, []
-
-        total_distance = 0.0
-        distances: list[float] = []
-        for i in range(len(route.sequence) - 1):
-            curr_distance = self.distance_manager.get_distance(route.sequence[i], route.sequence[i + 1])
-            distances.append(curr_distance)
-            total_distance += curr_distance
-
-        if not distances:
-            return 0.0, []
+        The edge distances are cached on the route.
+        """
+        if len(route) < MIN_ROUTE_NODES:
+            return 0.0, np.empty(0, dtype=self.distance_manager.distance_matrix.dtype)
 
-        return total_distance, distances
+        if route.edge_distances is None:
+            route.edge_distances = self.distance_manager.distance_matrix[route.ids[:-1], route.ids[1:]]
+        distances = route.edge_distances
+        return float(distances.sum(dtype=np.float64)), distances
 
     def total_distance(self, route: Route) -> float:
         """Calculate the total distance of the route."""
@@ -84,7 +95,7 @@ class RouteEvaluator:
 
     def calculate_objective_value(
         self,
-        route: Route,
+        route: Route | np.ndarray,
     ) -> float:
         """Calculate the objective function value: L·Δ + D.
 
@@ -94,21 +105,29 @@ class RouteEvaluator:
         - D = total distance of the route
         - n = number of nodes (excluding start and end depot nodes)
 
+        The value of a route is cached on it.
+
         Args:
-            route: The route to evaluate
+            route: The route to evaluate, or the node IDs of its sequence
 
         Returns:
             The objective function value
 
         """
+        if isinstance(route, np.ndarray):
+            return self._objective_from_sequence_ids(route)
+        if route.objective_value is not None:
+            return route.objective_value
+
         # Calculate D (total distance)
         d_value, distances = self.total_distance_and_distances(route=route)
 
         # Calculate Δ (delta)
-        max_distance = max(distances)
-        min_distance = min(distances)
+        max_distance = float(distances.max()) if distances.size else 0.0
+        min_distance = float(distances.min()) if distances.size else 0.0
         delta = max_distance - min_distance
-        self.logger.debug(f"Delta calculation: maxD={max_distance}, minD={min_distance}, Δ={delta}")
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"Delta calculation: maxD={max_distance}, minD={min_distance}, Δ={delta}")
 
         # Calculate L
         l_value = get_l_value(self.node_manager, self.distance_manager)
@@ -116,13 +135,35 @@ class RouteEvaluator:
         # Calculate objective value
         objective_value = l_value * delta + d_value
 
-        self.logger.debug(
-            f"Objective calculation: L={l_value:.2f}, Δ={delta:.2f}, D={d_value:.2f}, "
-            f"Objective={objective_value:.2f}",
-        )
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(
+                f"Objective calculation: L={l_value:.2f}, Δ={delta:.2f}, D={d_value:.2f}, "
+                f"Objective={objective_value:.2f}",
+            )
 
+        route.objective_value = objective_value
         return objective_value
 
+    def _objective_from_sequence_ids(self, sequence_ids: np.ndarray) -> float:
+        """Calculate L·Δ + D with one gather over the distance matrix."""
+        if len(sequence_ids) < MIN_ROUTE_NODES:
+            return 0.0
+
+        distances = self.distance_manager.distance_matrix[sequence_ids[:-1], sequence_ids[1:]]
+        d_value = float(distances.sum(dtype=np.float64))
+        delta = float(distances.max()) - float(distances.min())
+        l_value = get_l_value(self.node_manager, self.distance_manager)
+        return l_value * delta + d_value
+
+    def visits_intermediate_nodes_once(self, intermediate_ids: np.ndarray) -> bool:
+        """Check if the node IDs are a permutation of the intermediate nodes 1..n."""
+        n = self.node_manager.n
+        return (
+            len(intermediate_ids) == n
+            and not ((intermediate_ids < 1) | (intermediate_ids > n)).any()
+            and not (np.bincount(intermediate_ids, minlength=n + 1)[1:] != 1).any()
+        )
+
     def is_valid_route(
         self,
         route: Route,
@@ -143,64 +184,50 @@ class RouteEvaluator:
             True if the route is valid, False otherwise
 
         """
-        if len(route.sequence) < MIN_ROUTE_NODES:
+        if len(route) < MIN_ROUTE_NODES:
             self.logger.warning("Route has fewer than 2 nodes")
             return False
 
+        ids = route.ids
+
         # Check if route starts at node 0
-        if route.sequence[0].id not in {"0", 0}:
-            self.logger.warning(f"Route does not start at node 0, starts at {route.sequence[0].id}")
+        if ids[0] != 0:
+            self.logger.warning(f"Route does not start at node 0, starts at {ids[0]}")
             return False
 
-        # Get all node IDs and sort them to determine n
-        # assuming node IDs are integers
-        all_node_ids = sorted([int(node_id) for node_id in self.node_manager.all_node_ids()])
-        n = len(all_node_ids) - 2  # Excluding 0 and n+1
+        # Node IDs are 0..n+1
+        n = self.node_manager.n
 
         # Check if route ends at node n+1
         expected_end_id = n + 1
-        if int(route.sequence[-1].id) != expected_end_id:
-            self.logger.warning(f"Route does not end at node {expected_end_id}, ends at {route.sequence[-1].id}")
+        if ids[-1] != expected_end_id:
+            self.logger.warning(f"Route does not end at node {expected_end_id}, ends at {ids[-1]}")
             return False
 
         # Check if all intermediate nodes are visited exactly once
-        intermediate_nodes = [int(node.id) for node in route.sequence[1:-1]]
-        expected_intermediate = list(range(1, n + 1))
-
-        if sorted(intermediate_nodes) != sorted(expected_intermediate):
+        if not self.visits_intermediate_nodes_once(ids[1:-1]):
             self.logger.warning("Not all intermediate nodes are visited exactly once")
             return False
 
-        # Check sequence constraints for consecutive node pairs
-        expected_start_id = 0
-        for i in range(len(route.sequence) - 1):
-            current_node = route.sequence[i]
-            next_node = route.sequence[i + 1]
-
-            # Skip constraints for depot nodes (0 and n+1)
-            if int(current_node.id) == expected_start_id or int(current_node.id) == expected_end_id:
-                continue
-            if int(next_node.id) == expected_start_id or int(next_node.id) == expected_end_id:
-                continue
-
-            current_id = int(current_node.id)
-            next_id = int(next_node.id)
-
-            # Constraint 1: Even→Odd forbidden when i < n/2
-            if current_id % 2 == 0 and next_id % 2 == 1 and current_id < n / 2:
+        # Check sequence constraints for consecutive node pairs, all at once
+        # (transitions from or to a depot node are always valid)
+        is_valid_transition = self.valid_transition_matrix()[ids[:-1], ids[1:]]
+        if not is_valid_transition.all():
+            violation = int(np.argmin(is_valid_transition))
+            current_id, next_id = int(ids[violation]), int(ids[violation + 1])
+            if current_id % 2 == 0:
+                # Constraint 1: Even→Odd forbidden when i < n/2
                 self.logger.warning(
                     f"Constraint violated: Even→Odd transition from {current_id} to {next_id} "
                     f"with {current_id} < n/2 (n={n})",
                 )
-                return False
-
-            # Constraint 2: Odd→Even forbidden when i >= n/2
-            if current_id % 2 == 1 and next_id % 2 == 0 and current_id >= n / 2:
+            else:
+                # Constraint 2: Odd→Even forbidden when i >= n/2
                 self.logger.warning(
                     f"Constraint violated: Odd→Even transition from {current_id} to {next_id} "
                     f"with {current_id} >= n/2 (n={n})",
                 )
-                return False
+            return False
 
         self.logger.info("Route is valid")
         return True
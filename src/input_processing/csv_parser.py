@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import numpy as np
+
 from schemas.node import Node
 from utils.logger import Logger
 
@@ -24,22 +26,26 @@ class CSVParser:
             filepath: Path | str,
         ) -> list[Node]:
         """Parse a CSV file into a list of Node objects."""
-        nodes: list[Node] = []
-        if isinstance(filepath, str):
-            filepath = Path(filepath)
-        with filepath.open("r") as file:
-            for line_idx, line in enumerate(file):
-                if line_idx == 0 and SKIP_HEADER:
-                    continue  # Skip header line
-                parts = line.strip().split(",")
-                if len(parts) != EXPECTED_NUM_FIELDS:
-                    self.logger.warning(
-                        f"Skipping invalid line in CSV: {line.strip()}",
-                    )
-                node = Node(
-                    id=parts[0],
-                    x=float(parts[1]),
-                    y=float(parts[2]),
-                )
-                nodes.append(node)
-        return nodes
+        node_ids, xs, ys = self.parse_arrays(filepath=filepath)
+        return [
+            Node(id=node_id, x=x, y=y)
+            for node_id, x, y in zip(node_ids.tolist(), xs.tolist(), ys.tolist(), strict=True)
+        ]
+
+    def parse_arrays(
+            self,
+            filepath: Path | str,
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parse a CSV file into column arrays of node IDs, x and y coordinates."""
+        try:
+            table = np.loadtxt(
+                filepath,
+                delimiter=",",
+                skiprows=1 if SKIP_HEADER else 0,
+                usecols=range(EXPECTED_NUM_FIELDS),
+                ndmin=2,
+            )
+        except ValueError:
+            self.logger.error(f"Invalid CSV content in {filepath}, expected {EXPECTED_NUM_FIELDS} numeric fields")
+            raise
+        return table[:, 0].astype(np.int64), table[:, 1], table[:, 2]
@@ -1,3 +1,5 @@
+import numpy as np
+
 from schemas.node import Node
 
 
@@ -7,5 +9,22 @@ class NodeValidator:
     @staticmethod
     def validate(node: Node) -> bool:
         """Validate a Node object."""
+        return bool(NodeValidator.validate_batch(
+            np.array([node.id]),
+            np.array([node.x]),
+            np.array([node.y]),
+        )[0])
+
+    @staticmethod
+    def validate_batch(
+            node_ids: np.ndarray,
+            xs: np.ndarray,
+            ys: np.ndarray,
+        ) -> np.ndarray:
+        """Validate node columns in one vectorised pass.
+
+        Returns:
+            Boolean mask, True where the node is valid
 
-        return isinstance(node.id, int) and node.id >= 0 and isinstance(node.x, float) and isinstance(node.y, float)
+        """
+        return (node_ids >= 0) & np.isfinite(xs) & np.isfinite(ys)
@@ -2,6 +2,7 @@
 import os
 from pathlib import Path
 
+import numpy as np
 from dotenv import load_dotenv
 
 from bounds.lower_bound import LowerBoundCalculator
@@ -19,7 +20,6 @@ from optimiser.iterative.local_search import LocalSearchImprover
 from optimiser.iterative.sa import SimulatedAnnealingImprover
 from optimiser.iterative.termination import Termination
 from report.route_export import RouteExporter
-from schemas.node import Node
 from utils.logger import Logger
 
 load_dotenv()
@@ -33,29 +33,43 @@ logger = Logger(__name__, level=LOGGER_LEVEL)
 # ==================
 # LOAD DATA
 
-nodes: list[Node] = CSVParser(logger=logger).parse(
+node_ids, node_xs, node_ys = CSVParser(logger=logger).parse_arrays(
     filepath=os.getenv("DATA_NODES_FILEPATH"),
 )
-logger.info(f"Parsed {len(nodes)} nodes from CSV file.")
+logger.info(f"Parsed {len(node_ids)} nodes from CSV file.")
 
 Path(os.getenv("OUTPUT_DIR")).mkdir(parents=True, exist_ok=True)
 
 # ==================
 # PRECOMPUTE DATA
 
+is_valid = NodeValidator.validate_batch(node_ids, node_xs, node_ys)
+for node_id, x, y in zip(node_ids[~is_valid], node_xs[~is_valid], node_ys[~is_valid], strict=True):
+    logger.error(f"Invalid node data: id={node_id} x={x} y={y}")
+
+# node IDs double as distance matrix indices, so skipping a node must not leave a gap
+valid_ids = node_ids[is_valid]
+unique_ids, id_counts = np.unique(valid_ids, return_counts=True)
+missing_ids = np.setdiff1d(np.arange(unique_ids[-1] + 1 if unique_ids.size else 0), unique_ids)
+duplicate_ids = unique_ids[id_counts > 1]
+if missing_ids.size or duplicate_ids.size:
+    logger.error(
+        f"Node IDs must be the consecutive integers 0..n+1 (see README), "
+        f"missing IDs: {missing_ids.tolist()}, duplicate IDs: {duplicate_ids.tolist()}",
+    )
+    raise SystemExit(1)
+
 node_mngr = NodeManager(logger=logger)
+node_mngr.load_bulk(node_ids[is_valid], node_xs[is_valid], node_ys[is_valid])
 edge_mngr = EdgeManager(logger=logger)
-for node in nodes:
-    if not NodeValidator.validate(node):
-        logger.error(f"Invalid node data: {node}")
-    else:
-        node_mngr.add_node(node)
-        edge_mngr.add_node(node)
+for node in node_mngr.all_nodes():
+    edge_mngr.add_node(node)
 
 logger.level = "INFO"
 distance_mngr = EuclidianDistanceManager(
-    nb_of_nodes=len(nodes),
+    coords=node_mngr.coords(),
     logger=logger,
+    cache_dir=os.getenv("DISTANCE_CACHE_DIR"),
 )
 
 # ==================
@@ -178,7 +192,9 @@ callback.plot_iterations(
 # OPTIMISATION: ITERATIVE IMPROVEMENT: LOCAL SEARCH
 
 termination.reset()
-callback = Callback()
+callback = Callback(
+    jsonl_filepath=Path(os.getenv("OUTPUT_DIR"), "LocalSearchImprover_iter.jsonl").absolute(),
+)
 improver = LocalSearchImprover(
     logger=logger,
     node_manager=node_mngr,
@@ -216,12 +232,15 @@ callback.plot_iterations(
     title=title,
     filepath=Path(os.getenv("OUTPUT_DIR"), f"{title}_iter.png").absolute(),
 )
+callback.close()
 
 # ==================
 # OPTIMISATION: ITERATIVE IMPROVEMENT: SIMULATED ANNEALING
 
 termination.reset()
-callback = Callback()
+callback = Callback(
+    jsonl_filepath=Path(os.getenv("OUTPUT_DIR"), "SimulatedAnnealingImprover_iter.jsonl").absolute(),
+)
 improver = SimulatedAnnealingImprover(
     logger=logger,
     node_manager=node_mngr,
@@ -262,3 +281,5 @@ callback.plot_iterations(
     title=title,
     filepath=Path(os.getenv("OUTPUT_DIR"), f"{title}_iter.png").absolute(),
 )
+callback.close()
+route_exporter.close()
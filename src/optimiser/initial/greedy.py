@@ -32,7 +32,7 @@ class GreedySequencer:
         all_nodes = self.node_manager.all_nodes()
         if not all_nodes:
             self.logger.warning("No nodes available for optimisation.")
-            return Route(nodes=[])
+            return Route(name="greedy", sequence=[])
 
         curr_node = all_nodes[0]  # Start at the depot
         route_nodes = [curr_node]
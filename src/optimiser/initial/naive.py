@@ -23,7 +23,7 @@ class NaiveSequencer:
         all_nodes = self.node_manager.all_nodes()
         if not all_nodes:
             self.logger.warning("No nodes available for optimisation.")
-            return Route(nodes=[])
+            return Route(name="naive", sequence=[])
         origin = all_nodes[0]
         destination = all_nodes[-1]
         even_indexed_nodes = [node for index, node in enumerate(all_nodes[1:-1]) if index % 2 == 0]
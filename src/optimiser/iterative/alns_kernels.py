@@ -0,0 +1,154 @@
+"""Numba kernels for the ALNS destroy and repair operators.
+
+A solution is encoded as a successor array: `successors[i]` is the ID of the
+node visited after node `i`, or `MISSING_EDGE` if node `i` has no outgoing edge.
+"""
+
+import numpy as np
+from numba import njit
+
+MISSING_EDGE = -1
+
+
+@njit(cache=True, fastmath=True)
+def worst_removal_kernel(
+        successors: np.ndarray,
+        distance_matrix: np.ndarray,
+        num_to_remove: int,
+    ) -> None:
+    """Remove (in place) the `num_to_remove` edges with the largest distance."""
+    nb_of_nodes = successors.shape[0]
+    # distances are >= 0, so -1 ranks missing edges last without an infinite
+    # sentinel, which fastmath assumes never occurs
+    edge_distances = np.full(nb_of_nodes, -1.0)
+    nb_of_edges = 0
+    for node in range(nb_of_nodes):
+        if successors[node] != MISSING_EDGE:
+            edge_distances[node] = distance_matrix[node, successors[node]]
+            nb_of_edges += 1
+
+    num_to_remove = min(num_to_remove, nb_of_edges)
+    if num_to_remove <= 0:
+        return
+    worst_nodes = np.argpartition(-edge_distances, num_to_remove - 1)[:num_to_remove]
+    for node in worst_nodes:
+        successors[node] = MISSING_EDGE
+
+
+@njit(cache=True)
+def random_removal_kernel(
+        successors: np.ndarray,
+        num_to_remove: int,
+        rng: np.random.Generator,
+    ) -> None:
+    """Remove (in place) `num_to_remove` edges drawn uniformly at random.
+
+    Draws by rejection: the successor array doubles as the set of already
+    removed edges, so no scratch memory is needed. Efficient while
+    `num_to_remove` is a small fraction of the number of edges.
+    """
+    nb_of_nodes = successors.shape[0]
+    nb_of_edges = 0
+    for node in range(nb_of_nodes):
+        if successors[node] != MISSING_EDGE:
+            nb_of_edges += 1
+
+    num_to_remove = min(num_to_remove, nb_of_edges)
+    while num_to_remove > 0:
+        node = rng.integers(0, nb_of_nodes)
+        if successors[node] != MISSING_EDGE:
+            successors[node] = MISSING_EDGE
+            num_to_remove -= 1
+
+
+@njit(cache=True)
+def would_form_subcycle(successors: np.ndarray, from_node: int, to_node: int) -> bool:
+    """Check if adding the edge `from_node -> to_node` would close a subcycle.
+
+    Notice the offsets: we do not count the current node under consideration,
+    as it cannot yet be part of a cycle.
+    """
+    nb_of_nodes = successors.shape[0]
+    for step in range(1, nb_of_nodes):
+        if successors[to_node] == MISSING_EDGE:
+            return False
+
+        to_node = successors[to_node]
+
+        if from_node == to_node and step != nb_of_nodes - 1:
+            return True
+
+    return False
+
+
+@njit(cache=True, fastmath=True)
+def greedy_repair_kernel(
+        successors: np.ndarray,
+        distance_matrix: np.ndarray,
+        valid_edges: np.ndarray,
+        orphans: np.ndarray,
+        start_node: int,
+    ) -> None:
+    """Connect (in place) each orphan, in the given order, to its nearest candidate.
+
+    Candidates are unvisited nodes (or the start node) reachable by a valid edge
+    that does not close a subcycle. If there is none, fall back to the nearest
+    node reachable by a valid edge.
+    """
+    nb_of_nodes = successors.shape[0]
+    visited = np.zeros(nb_of_nodes, dtype=np.bool_)
+    for node in range(nb_of_nodes):
+        if successors[node] != MISSING_EDGE:
+            visited[successors[node]] = True
+
+    for orphan in orphans:
+        # `nearest` doubles as the found flag, fastmath rules out an infinite sentinel
+        nearest = MISSING_EDGE
+        nearest_distance = 0.0
+        for other in range(nb_of_nodes):
+            if other == orphan or not valid_edges[orphan, other]:
+                continue
+            if visited[other] and other != start_node:
+                continue
+            if nearest != MISSING_EDGE and distance_matrix[orphan, other] >= nearest_distance:
+                continue
+            if would_form_subcycle(successors, orphan, other):
+                continue
+            nearest = other
+            nearest_distance = distance_matrix[orphan, other]
+
+        if nearest == MISSING_EDGE:
+            # Fallback: connect to nearest valid node
+            for other in range(nb_of_nodes):
+                if other == orphan or not valid_edges[orphan, other]:
+                    continue
+                if nearest == MISSING_EDGE or distance_matrix[orphan, other] < nearest_distance:
+                    nearest = other
+                    nearest_distance = distance_matrix[orphan, other]
+
+        if nearest != MISSING_EDGE:
+            successors[orphan] = nearest
+            visited[nearest] = True
+
+
+@njit(cache=True)
+def reconstruct_sequence_kernel(successors: np.ndarray, start_node: int) -> np.ndarray:
+    """Follow the successors from `start_node` and return the visited node IDs.
+
+    Returns an empty array if the walk hits a missing edge or a subcycle
+    before visiting every node, or if the last node does not lead back to
+    `start_node`.
+    """
+    nb_of_nodes = successors.shape[0]
+    sequence = np.empty(nb_of_nodes, dtype=np.int32)
+    visited = np.zeros(nb_of_nodes, dtype=np.bool_)
+    curr_node = start_node
+    for position in range(nb_of_nodes):
+        if curr_node == MISSING_EDGE or visited[curr_node]:
+            return sequence[:0]
+        sequence[position] = curr_node
+        visited[curr_node] = True
+        curr_node = successors[curr_node]
+    if curr_node != start_node:
+        return sequence[:0]  # the tour is not closed
+    return sequence
@@ -1,7 +1,6 @@
-import copy
-
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 import numpy.random as rnd
 from alns import ALNS
 from alns.accept import LateAcceptanceHillClimbing
@@ -11,6 +10,13 @@ from alns.stop import MaxRuntime
 from datastore.distance_manager import EuclidianDistanceManager
 from datastore.edge_manager import EdgeManager
 from eval.route_eval import RouteEvaluator
+from optimiser.iterative.alns_kernels import (
+    MISSING_EDGE,
+    greedy_repair_kernel,
+    random_removal_kernel,
+    reconstruct_sequence_kernel,
+    worst_removal_kernel,
+)
 from optimiser.iterative.iterative import IterativeOptimiser
 from optimiser.iterative.termination import Termination
 from schemas.node import Node
@@ -23,10 +29,18 @@ SEED = 42
 
 
 class SolutionState:
-    """Solution class."""
+    """Solution class.
+
+    The tour is held as a successor array indexed by node ID,
+    see `optimiser.iterative.alns_kernels`.
+    """
 
     nodes: list[Node]
-    edges: dict[Node, Node]
+    node_ids: np.ndarray
+    node_table: list[Node]
+    successors: np.ndarray
+    valid_edges: np.ndarray
+    k_destroy: int
     route_evaluator: RouteEvaluator
     edge_manager: EdgeManager
     distance_manager: EuclidianDistanceManager
@@ -38,47 +52,55 @@ class SolutionState:
             route_evaluator: RouteEvaluator,
             edge_manager: EdgeManager,
             distance_manager: EuclidianDistanceManager,
+            valid_edges: np.ndarray,
             logger: Logger | None = None,
         ) -> None:
         self.nodes = route.sequence
-        self.edges = {}
-        for idx in range(len(route.sequence) - 1):
-            self.edges[route.sequence[idx]] = route.sequence[idx + 1]
-        self.edges[route.sequence[-1]] = route.sequence[0]
+        self.node_ids = route.ids.copy()
+        self.node_table = route.node_table
+        self.successors = np.full(len(self.node_ids), MISSING_EDGE, dtype=np.int32)
+        self.successors[self.node_ids] = np.roll(self.node_ids, -1)
+        self.valid_edges = valid_edges
+        # number of edges each destroy operator removes
+        self.k_destroy = max(1, int(len(self.node_ids) * DEGREE_OF_DESTRUCTION))
         self.route_evaluator = route_evaluator
         self.edge_manager = edge_manager
         self.distance_manager = distance_manager
         self.logger = logger or Logger(__name__)
 
+    def clone(self) -> "SolutionState":
+        """Create a copy that owns its successor array and shares everything else."""
+        state = object.__new__(SolutionState)
+        state.nodes = self.nodes
+        state.node_ids = self.node_ids
+        state.node_table = self.node_table
+        state.successors = self.successors.copy()
+        state.valid_edges = self.valid_edges
+        state.k_destroy = self.k_destroy
+        state.route_evaluator = self.route_evaluator
+        state.edge_manager = self.edge_manager
+        state.distance_manager = self.distance_manager
+        state.logger = self.logger
+        return state
+
     def objective(self) -> float:
         """Calculate the objective value of the current solution."""
-        if len(self.edges) != len(self.nodes):
-            return float("inf")  # Incomplete solution
-        sequence = self._reconstruct_sequence()
-        if not sequence:
-            return float("inf")  # Invalid solution with subcycles
-        route = Route(name="temp", sequence=sequence)
-        return self.route_evaluator.calculate_objective_value(route=route)
-
-    def _reconstruct_sequence(self) -> list[Node]:
-        sequence = []
-        curr_node = self.nodes[0]
-        visited_nodes = set()
-        while len(sequence) < len(self.nodes):
-            if curr_node in visited_nodes:
-                break  # Cycle detected
-            sequence.append(curr_node)
-            visited_nodes.add(curr_node)
-
-            if curr_node not in self.edges:
-                break  # Edge missing
-            curr_node = self.edges[curr_node]
-        return sequence if len(sequence) == len(self.nodes) else []
+        sequence_ids = self._reconstruct_sequence_ids()
+        if not sequence_ids.size:
+            return float("inf")  # Incomplete solution, or invalid with subcycles
+        return self.route_evaluator.calculate_objective_value(route=sequence_ids)
+
+    def _reconstruct_sequence_ids(self) -> np.ndarray:
+        return reconstruct_sequence_kernel(self.successors, self.node_ids[0])
 
     def to_route(self) -> Route:
         """Convert the solution state back to a Route object."""
-        sequence = self._reconstruct_sequence()
-        return Route(name="ALNS", sequence=sequence)
+        return Route(
+            name="ALNS",
+            ids=self._reconstruct_sequence_ids(),
+            node_table=self.node_table,
+            copy=False,
+        )
 
     def to_graph(self) -> nx.Graph:
         """NetworkX helper method."""
@@ -87,144 +109,78 @@ class SolutionState:
         for node in self.nodes:
             graph.add_node(node.id, pos=(node.x, node.y))
 
-        for node_from, node_to in self.edges.items():
-            graph.add_edge(node_from.id, node_to.id)
+        for node_from_id, node_to_id in enumerate(self.successors.tolist()):
+            if node_to_id != MISSING_EDGE:
+                graph.add_edge(node_from_id, node_to_id)
 
         return graph
 
 
-def edges_to_remove(state: SolutionState) -> int:
-    """Calculate the number of edges to remove based on the degree of destruction."""
-    return int(len(state.edges) * DEGREE_OF_DESTRUCTION)
-
-
 def worst_removal(current: SolutionState, rng: rnd.Generator) -> SolutionState:
     """Remove the edges with the largest distance."""
-    destroyed = copy.deepcopy(current)
-
-    if not destroyed.edges:
-        return destroyed
+    destroyed = current.clone()
 
-    # Sort edges by distance (descending)
-    sorted_edges = sorted(
-        destroyed.edges.items(),
-        key=lambda item: current.distance_manager.calculate_distance(item[0], item[1]),
-        reverse=True,
+    worst_removal_kernel(
+        destroyed.successors,
+        current.distance_manager.distance_matrix,
+        current.k_destroy,
     )
 
-    # Remove the worst edges
-    num_to_remove = edges_to_remove(current)
-    for idx in range(min(num_to_remove, len(sorted_edges))):
-        node_from = sorted_edges[idx][0]
-        del destroyed.edges[node_from]
-
     return destroyed
 
 
 def path_removal(current: SolutionState, rng: rnd.Generator) -> SolutionState:
     """Remove a consecutive sub-path."""
-    destroyed = copy.deepcopy(current)
+    destroyed = current.clone()
 
     if not destroyed.nodes or len(destroyed.nodes) < 3:
         return destroyed
 
     # Randomly select a starting node
     node_idx = rng.choice(len(destroyed.nodes))
-    curr_node = destroyed.nodes[node_idx]
+    curr_node_id = destroyed.node_ids[node_idx]
 
     # Remove a path of consecutive edges
-    num_to_remove = edges_to_remove(current)
-    for _ in range(num_to_remove):
-        if curr_node not in destroyed.edges:
+    for _ in range(current.k_destroy):
+        next_node_id = destroyed.successors[curr_node_id]
+        if next_node_id == MISSING_EDGE:
             break
-        next_node = destroyed.edges[curr_node]
-        del destroyed.edges[curr_node]
-        curr_node = next_node
+        destroyed.successors[curr_node_id] = MISSING_EDGE
+        curr_node_id = next_node_id
 
     return destroyed
 
 
 def random_removal(current: SolutionState, rng: rnd.Generator) -> SolutionState:
     """Remove edges at random."""
-    destroyed = copy.deepcopy(current)
+    destroyed = current.clone()
 
-    num_to_remove = edges_to_remove(current)
-    node_indices = rng.choice(
-        len(destroyed.nodes),
-        min(num_to_remove, len(destroyed.nodes)),  # ✅ Ensure we don't remove more than exist
-        replace=False,
-    )
-
-    for idx in node_indices:
-        node = destroyed.nodes[idx]
-        if node in destroyed.edges:
-            del destroyed.edges[node]
+    random_removal_kernel(destroyed.successors, current.k_destroy, rng)
 
     return destroyed
 
 
-def would_form_subcycle(from_node: Node, to_node: Node, state: SolutionState) -> bool:
-    """Check if adding an edge would form a subcycle in the current state.
-
-    Notice the offsets: we do not count the current node under consideration,
-    as it cannot yet be part of a cycle.
-    """
-    for step in range(1, len(state.nodes)):
-        if to_node not in state.edges:
-            return False
-
-        to_node = state.edges[to_node]
-
-        if from_node == to_node and step != len(state.nodes) - 1:
-            return True
-
-    return False
-
-
 def greedy_repair(current: SolutionState, rng: rnd.Generator) -> SolutionState:
     """Repair the current solution greedily."""
-    nodes_with_outgoing = set(current.edges.keys())
-    orphaned_nodes = [node for node in current.nodes if node not in nodes_with_outgoing]
+    orphans = current.node_ids[current.successors[current.node_ids] == MISSING_EDGE]
 
-    if not orphaned_nodes:
+    if not orphans.size:
         return current  # Already complete
 
-    # Track visited nodes (those already in the tour)
-    visited = set(current.edges.values())
-
     # This kind of randomness ensures we do not cycle between the same
     # destroy and repair steps every time.
-    shuffled_idcs = rng.permutation(len(orphaned_nodes))
-    orphaned_nodes = [orphaned_nodes[idx] for idx in shuffled_idcs]
-
-    for orphan in orphaned_nodes:
-        # Find valid unvisited nodes this orphan can connect to
-        candidates = {
-            other for other in current.nodes
-            if other != orphan
-            if other not in visited or other == current.nodes[0]  # Allow returning to start
-            if not would_form_subcycle(orphan, other, current)
-            if current.edge_manager.is_edge_valid(orphan, other)
-        }
-
-        if not candidates:
-            # Fallback: connect to nearest valid node
-            candidates = {
-                other for other in current.nodes
-                if other != orphan
-                if current.edge_manager.is_edge_valid(orphan, other)
-            }
-
-        if candidates:
-            # Connect to the nearest candidate
-            nearest = min(
-                candidates,
-                key=lambda other: current.distance_manager.calculate_distance(orphan, other),
-            )
-            current.edges[orphan] = nearest
-            visited.add(nearest)
-        else:
-            current.logger.warning(f"Could not repair edge for orphaned node {orphan.id}")
+    rng.shuffle(orphans)  # in place, orphans is already a fresh array
+
+    greedy_repair_kernel(
+        current.successors,
+        current.distance_manager.distance_matrix,
+        current.valid_edges,
+        orphans,
+        current.node_ids[0],  # Allow returning to start
+    )
+
+    for orphan_id in orphans[current.successors[orphans] == MISSING_EDGE]:
+        current.logger.warning(f"Could not repair edge for orphaned node {orphan_id}")
 
     return current
 
@@ -261,6 +217,7 @@ class ALNSWrapper(IterativeOptimiser):
             route_evaluator=self.route_evaluator,
             distance_manager=self.distance_manager,
             edge_manager=self.edge_manager,
+            valid_edges=self.edge_manager.valid_edge_matrix(),
             logger=self.logger,
         )
 
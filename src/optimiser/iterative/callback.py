@@ -1,21 +1,72 @@
 import json
+from array import array
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TextIO
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from schemas.route import Route
 
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+JSON_SEPARATORS = (",", ":")  # compact, no whitespace
+
 
 class Callback:
-    """Base class for optimiser callbacks."""
+    """Base class for optimiser callbacks.
+
+    Iteration records are kept in memory, or, given a JSONL file, streamed to it
+    one line per iteration so that memory use does not grow with the run length.
+    """
 
     iterations: list[dict[str, float]]
     routes: dict[int, Route]
+    jsonl_filepath: Path | None
+    _jsonl_file: TextIO | None
 
-    def __init__(self) -> None:
-        """Initialise the callback instance."""
+    def __init__(self, jsonl_filepath: Path | None = None) -> None:
+        """Initialise the callback instance.
+
+        Args:
+            jsonl_filepath: The path to stream the iteration records to
+                (None to keep them in memory).
+
+        """
         self.iterations = []
         self.routes = {}
+        self.jsonl_filepath = jsonl_filepath
+        self._jsonl_file = None
+        if jsonl_filepath is not None:
+            Path(jsonl_filepath).parent.mkdir(parents=True, exist_ok=True)
+            self._jsonl_file = Path(jsonl_filepath).open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+
+    def _record_iteration(self, record: dict[str, float]) -> None:
+        """Store an iteration record, see `iteration_records`."""
+        if self._jsonl_file is None:
+            self.iterations.append(record)
+        else:
+            self._jsonl_file.write(json.dumps(record, separators=JSON_SEPARATORS) + "\n")
+
+    def iteration_records(self) -> Iterator[dict[str, float]]:
+        """Iterate over the iteration records, from memory or from the JSONL file."""
+        if self._jsonl_file is None:
+            yield from self.iterations
+            return
+        self._flush_jsonl()
+        with Path(self.jsonl_filepath).open(encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def _flush_jsonl(self) -> None:
+        """Flush the buffered records to the JSONL file, before reading it back."""
+        if not self._jsonl_file.closed:
+            self._jsonl_file.flush()
+
+    def close(self) -> None:
+        """Flush and close the JSONL file, if any. Records can still be read back."""
+        if self._jsonl_file is not None and not self._jsonl_file.closed:
+            self._jsonl_file.close()
 
     def load_alns_result_statistics(
         self,
@@ -29,18 +80,20 @@ class Callback:
                 such as objectives and runtimes.
 
         """
+        # `runtimes` is recomputed from the raw timings on every read
+        runtimes = statistics.runtimes
         best_value = statistics.objectives[0]
         for i, curr_value in enumerate(statistics.objectives):
-            self.iterations.append({
+            record = {
                 "iteration": i,
                 "current_value": float(curr_value),
                 "best_value": float(best_value),
                 "improved": float(curr_value < best_value),
-            })
+            }
+            if i < len(runtimes):
+                record["runtime"] = float(runtimes[i])
+            self._record_iteration(record)
             best_value = min(best_value, curr_value)
-        for i, val in enumerate(statistics.runtimes):
-            if i < len(self.iterations):
-                self.iterations[i]["runtime"] = float(val)
 
     def on_iteration(
         self,
@@ -60,7 +113,7 @@ class Callback:
             improved: Whether the best solution was improved in this iteration.
 
         """
-        self.iterations.append({
+        self._record_iteration({
             "iteration": iteration,
             "current_value": current_value,
             "best_value": best_value,
@@ -89,9 +142,17 @@ class Callback:
             filepath: The path to the output JSON file.
 
         """
-
-        with Path(filepath).open("w", encoding="utf-8") as f:
-            json.dump(self.iterations, f, indent=4)
+        with Path(filepath).open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            if self._jsonl_file is None:
+                json.dump(self.iterations, f, separators=JSON_SEPARATORS)
+                return
+            # join the JSONL lines into a JSON array, without parsing them
+            self._flush_jsonl()
+            f.write("[")
+            with Path(self.jsonl_filepath).open(encoding="utf-8") as jsonl_file:
+                for i, line in enumerate(jsonl_file):
+                    f.write(("," if i else "") + line.rstrip("\n"))
+            f.write("]")
 
     def routes_to_file(self, *, filepath: Path) -> None:
         """Export the saved routes to a JSON file.
@@ -102,12 +163,12 @@ class Callback:
         """
 
         route_sequences = {
-            iteration: [node.id for node in route.sequence]
+            iteration: route.ids.tolist()
             for iteration, route in self.routes.items()
         }
 
-        with Path(filepath).open("w", encoding="utf-8") as f:
-            json.dump(route_sequences, f, indent=4)
+        with Path(filepath).open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            json.dump(route_sequences, f, separators=JSON_SEPARATORS)
 
     def plot_iterations(
         self,
@@ -121,9 +182,15 @@ class Callback:
             filepath: The path to the output image file.
 
         """
-        iterations = [record["iteration"] for record in self.iterations]
-        current_values = [record["current_value"] for record in self.iterations]
-        best_values = [record["best_value"] for record in self.iterations]
+        # one pass over the records, growing typed buffers that NumPy views without a copy
+        iteration_buffer, current_buffer, best_buffer = array("q"), array("d"), array("d")
+        for record in self.iteration_records():
+            iteration_buffer.append(record["iteration"])
+            current_buffer.append(record["current_value"])
+            best_buffer.append(record["best_value"])
+        iterations = np.frombuffer(iteration_buffer, dtype=np.int64)
+        current_values = np.frombuffer(current_buffer, dtype=np.float64)
+        best_values = np.frombuffer(best_buffer, dtype=np.float64)
 
         plt.figure(figsize=(10, 6))
         plt.plot(iterations, current_values, label="Current Value", color="blue")
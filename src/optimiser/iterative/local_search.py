@@ -74,7 +74,7 @@ class LocalSearchImprover:
         best_seed_routes = []
         best_seed_route_value = float("inf")
         for route in self.seed_routes:
-            self.logger.debug(f"Seed route with {len(route.sequence)} nodes.")
+            self.logger.debug(f"Seed route with {len(route)} nodes.")
             route_value = self.route_eval.calculate_objective_value(route=route)
             if route_value < best_seed_route_value:
                 best_seed_route_value = route_value
@@ -1,11 +1,20 @@
-from random import SystemRandom
+from random import Random
 
-from eval.route_eval import RouteEvaluator
+import numpy as np
+
+from eval.route_eval import RouteEvaluator, get_l_value
 from optimiser.iterative.operations.operation import Operation
+from optimiser.iterative.operations.relocate_kernels import (
+    NO_MOVE,
+    search_best_relocate_parallel_kernel,
+    search_relocate_kernel,
+)
 from schemas.route import Route
 from utils.logger import Logger
 
 MIN_ROUTE_LENGTH = 4
+# below this, starting the worker threads costs more than the best-improvement search itself
+PARALLEL_MIN_ROUTE_LENGTH = 32
 
 
 class Relocate(Operation):
@@ -27,7 +36,7 @@ class Relocate(Operation):
 
     logger: Logger
     rnd_seed: int
-    rnd_generator: SystemRandom
+    rnd_generator: Random
     route_eval: RouteEvaluator
 
     def __init__(
@@ -39,7 +48,7 @@ class Relocate(Operation):
         """Initialise the operation."""
         self.route_eval = route_eval
         self.rnd_seed = rnd_seed
-        self.rnd_generator = SystemRandom(x=self.rnd_seed)
+        self.rnd_generator = Random(self.rnd_seed)
         self.logger = logger or Logger(__name__)
 
     def apply(
@@ -64,7 +73,7 @@ class Relocate(Operation):
             The modified route (either new or the same object if inplace=True)
 
         """
-        route_length = len(route.sequence)
+        route_length = len(route)
 
         # Need at least 4 nodes to perform relocate
         if route_length < MIN_ROUTE_LENGTH:
@@ -90,13 +99,15 @@ class Relocate(Operation):
 
         # Generate random insert position if not provided
         if insert_pos is None:
-            # Can insert at any position except within the extracted segment
-            valid_positions = [i for i in range(route_length - (v2 - v1 + 1))
-                             if not (v1 <= i <= v2)]
-            if not valid_positions:
+            # Can insert at any position in range(route_length - segment length) except within
+            # the extracted segment, i.e. in [0, v1) or [v2 + 1, route_length - segment length)
+            num_left = v1
+            num_right = max(0, route_length - (v2 - v1 + 1) - (v2 + 1))
+            if num_left + num_right == 0:
                 self.logger.warning("No valid insertion positions available")
                 return route if inplace else route.copy()
-            insert_pos = self.rnd_generator.choice(valid_positions)
+            k = self.rnd_generator.randrange(num_left + num_right)
+            insert_pos = k if k < num_left else (k - num_left) + (v2 + 1)
         elif insert_pos < 0 or insert_pos >= route_length - (v2 - v1 + 1):
             # Validate insert_pos
             self.logger.error(
@@ -105,40 +116,43 @@ class Relocate(Operation):
             return route if inplace else route.copy()
 
         segment_length = v2 - v1 + 1
-        self.logger.debug(
-            f"Applying relocate: moving segment [{v1}:{v2}] (length={segment_length}) "
-            f"to position {insert_pos}",
-        )
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(
+                f"Applying relocate: moving segment [{v1}:{v2}] (length={segment_length}) "
+                f"to position {insert_pos}",
+            )
 
         # Extract the segment to relocate
-        segment = route.sequence[v1:v2 + 1]
+        segment = route.ids[v1:v2 + 1]
 
         # Create new sequence without the segment
-        new_sequence = route.sequence[:v1] + route.sequence[v2 + 1:]
+        new_ids = np.concatenate((route.ids[:v1], route.ids[v2 + 1:]))
 
         # Adjust insert position if needed (after removal, positions shift)
         adjusted_insert_pos = insert_pos if insert_pos < v1 else insert_pos - segment_length
 
         # Insert the segment at the new position
-        new_sequence = (
-            new_sequence[:adjusted_insert_pos] +
-            segment +
-            new_sequence[adjusted_insert_pos:]
-        )
+        new_ids = np.concatenate((
+            new_ids[:adjusted_insert_pos],
+            segment,
+            new_ids[adjusted_insert_pos:],
+        ))
 
         # Apply the change
         if inplace:
-            route.sequence = new_sequence
-            self.logger.debug(
-                f"Applied relocate in place: segment [{v1}:{v2}] to position {insert_pos}",
-            )
+            route.ids = new_ids
+            if self.logger.is_enabled_for("DEBUG"):
+                self.logger.debug(
+                    f"Applied relocate in place: segment [{v1}:{v2}] to position {insert_pos}",
+                )
             return route
 
         # Create a new route
-        new_route = Route(name=route.name, sequence=new_sequence, logger=self.logger)
-        self.logger.debug(
-            f"Created new route with relocate: segment [{v1}:{v2}] to position {insert_pos}",
-        )
+        new_route = route.with_ids(new_ids, copy=False)
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(
+                f"Created new route with relocate: segment [{v1}:{v2}] to position {insert_pos}",
+            )
         return new_route
 
     def apply_best_improvement(
@@ -159,56 +173,24 @@ class Relocate(Operation):
             The improved route (or original if no improvement found)
 
         """
-        best_route = route.copy()
-        orig_value = best_value = self.route_eval.calculate_objective_value(route)
-        improved = False
-
-        route_length = len(route.sequence)
-        evaluations = 0
-
-        # Try all possible relocate moves
-        for v1 in range(1, route_length - 2):
-            for v2 in range(v1, route_length - 2):
-                segment_length = v2 - v1 + 1
-                # Determine valid insertion positions
-                for insert_pos in range(0, route_length - segment_length):
-                    # Skip positions within or adjacent to the segment
-                    if v1 <= insert_pos <= v2 + 1:
-                        continue
-
-                    # Create new route with this relocate
-                    new_route = self.apply(
-                        route,
-                        v1=v1,
-                        v2=v2,
-                        insert_pos=insert_pos,
-                        inplace=False,
-                    )
-                    if only_valid and not self.route_eval.is_valid_route(route=new_route):
-                        continue
-                    new_value = self.route_eval.calculate_objective_value(route=new_route)
-                    evaluations += 1
-
-                    # Check if this is an improvement
-                    if new_value < best_value:
-                        best_route = new_route
-                        best_value = new_value
-                        improved = True
-                        self.logger.debug(
-                            f"Found improvement with relocate [{v1}:{v2}] to {insert_pos}: "
-                            f"value reduced to {new_value:.2f}",
-                        )
-
-        if improved:
-            self.logger.info(
-                f"Best relocate improvement found after {evaluations} evaluations: "
-                f"value reduced from {orig_value:.2f} to {best_value:.2f}",
-            )
-        else:
+        v1, v2, insert_pos, evaluations = self._search(
+            route,
+            only_valid=only_valid,
+            first_improvement=False,
+        )
+
+        if v1 == NO_MOVE:
             self.logger.debug(
                 f"No relocate improvement found after {evaluations} evaluations",
             )
+            return route.copy()
 
+        best_route = self.apply(route, v1=v1, v2=v2, insert_pos=insert_pos, inplace=False)
+        self.logger.info(
+            f"Best relocate improvement found after {evaluations} evaluations: "
+            f"value reduced from {self.route_eval.calculate_objective_value(route):.2f} "
+            f"to {self.route_eval.calculate_objective_value(best_route):.2f}",
+        )
         return best_route
 
     def apply_first_improvement(
@@ -229,40 +211,63 @@ class Relocate(Operation):
             The improved route (or original if no improvement found)
 
         """
-        curr_value = self.route_eval.calculate_objective_value(route)
-        route_length = len(route.sequence)
-        evaluations = 0
-
-        # Try relocate moves until we find an improvement
-        for v1 in range(1, route_length - 2):
-            for v2 in range(v1, route_length - 2):
-                segment_length = v2 - v1 + 1
-                for insert_pos in range(0, route_length - segment_length):
-                    # Skip positions within or adjacent to the segment
-                    if v1 <= insert_pos <= v2 + 1:
-                        continue
-
-                    # Create new route with this relocate
-                    new_route = self.apply(
-                        route,
-                        v1=v1,
-                        v2=v2,
-                        insert_pos=insert_pos,
-                        inplace=False,
-                    )
-                    if only_valid and not self.route_eval.is_valid_route(route=new_route):
-                        continue
-                    new_value = self.route_eval.calculate_objective_value(route=new_route)
-                    evaluations += 1
-
-                    # Return immediately if we find an improvement
-                    if new_value < curr_value:
-                        self.logger.info(
-                            f"First relocate improvement found at [{v1}:{v2}] "
-                            f"to {insert_pos} after {evaluations} evaluations: "
-                            f"value reduced from {curr_value:.2f} to {new_value:.2f}",
-                        )
-                        return new_route
-
-        self.logger.debug(f"No relocate improvement found after {evaluations} evaluations")
-        return route
+        v1, v2, insert_pos, evaluations = self._search(
+            route,
+            only_valid=only_valid,
+            first_improvement=True,
+        )
+
+        if v1 == NO_MOVE:
+            self.logger.debug(f"No relocate improvement found after {evaluations} evaluations")
+            return route
+
+        new_route = self.apply(route, v1=v1, v2=v2, insert_pos=insert_pos, inplace=False)
+        self.logger.info(
+            f"First relocate improvement found at [{v1}:{v2}] "
+            f"to {insert_pos} after {evaluations} evaluations: "
+            f"value reduced from {self.route_eval.calculate_objective_value(route):.2f} "
+            f"to {self.route_eval.calculate_objective_value(new_route):.2f}",
+        )
+        return new_route
+
+    def _search(
+            self,
+            route: Route,
+            *,
+            only_valid: bool,
+            first_improvement: bool,
+        ) -> tuple[int, int, int, int]:
+        """Search the relocate moves of the route with the compiled kernel.
+
+        The best-improvement search of long routes runs in parallel over the segment starts.
+
+        Returns:
+            (v1, v2, insert_pos) of the move to apply, `NO_MOVE` if there is none,
+            and the number of evaluated moves
+
+        """
+        # relocation keeps the visited nodes, so if the route misses some, every candidate does
+        if only_valid and not self.route_eval.visits_intermediate_nodes_once(route.ids[1:-1]):
+            return NO_MOVE, NO_MOVE, NO_MOVE, 0
+
+        distance_matrix = self.route_eval.distance_manager.distance_matrix
+        valid_transitions = self.route_eval.valid_transition_matrix()
+        l_value = get_l_value(self.route_eval.node_manager, self.route_eval.distance_manager)
+        if not first_improvement and len(route) >= PARALLEL_MIN_ROUTE_LENGTH:
+            v1, v2, insert_pos, _, evaluations = search_best_relocate_parallel_kernel(
+                route.ids,
+                distance_matrix,
+                valid_transitions,
+                l_value,
+                only_valid,
+            )
+        else:
+            v1, v2, insert_pos, _, evaluations = search_relocate_kernel(
+                route.ids,
+                distance_matrix,
+                valid_transitions,
+                l_value,
+                only_valid,
+                first_improvement,
+            )
+        return int(v1), int(v2), int(insert_pos), int(evaluations)
@@ -0,0 +1,271 @@
+"""Numba kernels for the relocate operation.
+
+A route is encoded as an array of node IDs, in visiting order.
+`NO_MOVE` marks that a search found no improving move.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+NO_MOVE = -1
+MIN_ROUTE_LENGTH = 4  # a segment needs a node before it, and one after it other than the end
+# a relocate move removes at most 3 edges, so one of the 4 extreme edges always survives
+NB_OF_EXTREME_EDGES = 4
+
+
+@njit(cache=True)
+def _surviving_extreme(
+        edge_distances: np.ndarray,
+        extreme_edges: np.ndarray,
+        removed_1: int,
+        removed_2: int,
+        removed_3: int,
+        default: float,
+    ) -> float:
+    """Get the distance of the first edge in `extreme_edges` that the move does not remove.
+
+    `default` is returned if the move removes them all, it must be finite as the kernels use fastmath.
+    """
+    for edge in extreme_edges:
+        if edge not in (removed_1, removed_2, removed_3):
+            return edge_distances[edge]
+    return default
+
+
+@njit(cache=True)
+def _route_stats(
+        sequence: np.ndarray,
+        distance_matrix: np.ndarray,
+        valid_transitions: np.ndarray,
+    ) -> tuple[np.ndarray, int, float, np.ndarray, np.ndarray]:
+    """Get the edge distances, number of invalid transitions, total distance,
+    and the shortest and longest edges of a route.
+    """
+    route_length = sequence.shape[0]
+    edge_distances = np.empty(route_length - 1)
+    nb_of_invalid = 0
+    for edge in range(route_length - 1):
+        edge_distances[edge] = distance_matrix[sequence[edge], sequence[edge + 1]]
+        nb_of_invalid += not valid_transitions[sequence[edge], sequence[edge + 1]]
+    edges_by_distance = np.argsort(edge_distances)
+    shortest_edges = edges_by_distance[:NB_OF_EXTREME_EDGES]
+    longest_edges = edges_by_distance[::-1][:NB_OF_EXTREME_EDGES]
+    return edge_distances, nb_of_invalid, edge_distances.sum(), shortest_edges, longest_edges
+
+
+@njit(cache=True)
+def _route_value(sequence: np.ndarray, distance_matrix: np.ndarray, l_value: float) -> float:
+    """Get the objective value of a route, 0 if it has no edges (see `RouteEvaluator`)."""
+    if sequence.shape[0] < 2:
+        return 0.0
+    edge_distances = np.empty(sequence.shape[0] - 1)
+    for edge in range(sequence.shape[0] - 1):
+        edge_distances[edge] = distance_matrix[sequence[edge], sequence[edge + 1]]
+    return l_value * (edge_distances.max() - edge_distances.min()) + edge_distances.sum()
+
+
+@njit(cache=True, fastmath=True)
+def _search_from(
+        v1: int,
+        sequence: np.ndarray,
+        distance_matrix: np.ndarray,
+        valid_transitions: np.ndarray,
+        l_value: float,
+        only_valid: bool,
+        first_improvement: bool,
+        edge_distances: np.ndarray,
+        nb_of_invalid: int,
+        total_distance: float,
+        shortest_edges: np.ndarray,
+        longest_edges: np.ndarray,
+        best_value: float,
+    ) -> tuple[int, int, float, int]:
+    """Search the relocate moves of the segments starting at position `v1`.
+
+    Returns:
+        (v2, insert_pos) of the best (or first) move improving on `best_value`,
+        both `NO_MOVE` if there is none, its objective value, and the number of
+        evaluated moves
+
+    """
+    route_length = sequence.shape[0]
+    best_v2 = NO_MOVE
+    best_insert_pos = NO_MOVE
+    evaluations = 0
+    before_segment = sequence[v1 - 1]
+    for v2 in range(v1, route_length - 2):
+        segment_length = v2 - v1 + 1
+        after_segment = sequence[v2 + 1]
+        for insert_pos in range(route_length - segment_length):
+            # Skip positions within or adjacent to the segment
+            if v1 <= insert_pos <= v2 + 1:
+                continue
+
+            # the segment lands between sequence[insert_pos - 1] and sequence[insert_pos]
+            insert_to = sequence[insert_pos]
+            removed_distance = edge_distances[v1 - 1] + edge_distances[v2]
+            added_1 = distance_matrix[before_segment, after_segment]
+            added_2 = distance_matrix[sequence[v2], insert_to]
+            added_3 = added_2  # no third edge unless inserting after a node, see below
+            added_distance = added_1 + added_2
+            nb_of_new_invalid = (
+                nb_of_invalid
+                - (not valid_transitions[before_segment, sequence[v1]])
+                - (not valid_transitions[sequence[v2], after_segment])
+                + (not valid_transitions[before_segment, after_segment])
+                + (not valid_transitions[sequence[v2], insert_to])
+            )
+            if insert_pos > 0:
+                insert_from = sequence[insert_pos - 1]
+                removed_distance += edge_distances[insert_pos - 1]
+                added_3 = distance_matrix[insert_from, sequence[v1]]
+                added_distance += added_3
+                nb_of_new_invalid += (
+                    - (not valid_transitions[insert_from, insert_to])
+                    + (not valid_transitions[insert_from, sequence[v1]])
+                )
+                first_node = sequence[0]
+            else:
+                first_node = sequence[v1]
+
+            if only_valid and (nb_of_new_invalid or first_node != 0):
+                continue
+            evaluations += 1
+
+            new_distance = total_distance + (added_distance - removed_distance)
+            # the added edges bound the new delta from below, skip the extremes lookup
+            # for moves that cannot beat the best one anyway
+            added_delta = max(added_1, added_2, added_3) - min(added_1, added_2, added_3)
+            if l_value * added_delta + new_distance >= best_value:
+                continue
+            removed_3 = insert_pos - 1 if insert_pos > 0 else NO_MOVE
+            max_distance = max(
+                added_1, added_2, added_3,
+                _surviving_extreme(edge_distances, longest_edges, v1 - 1, v2, removed_3, added_1),
+            )
+            min_distance = min(
+                added_1, added_2, added_3,
+                _surviving_extreme(edge_distances, shortest_edges, v1 - 1, v2, removed_3, added_1),
+            )
+            new_value = l_value * (max_distance - min_distance) + new_distance
+
+            if new_value < best_value:
+                best_value = new_value
+                best_v2 = v2
+                best_insert_pos = insert_pos
+                if first_improvement:
+                    return best_v2, best_insert_pos, best_value, evaluations
+
+    return best_v2, best_insert_pos, best_value, evaluations
+
+
+@njit(cache=True, fastmath=True)
+def search_relocate_kernel(
+        sequence: np.ndarray,
+        distance_matrix: np.ndarray,
+        valid_transitions: np.ndarray,
+        l_value: float,
+        only_valid: bool,
+        first_improvement: bool,
+    ) -> tuple[int, int, int, float, int]:
+    """Search the relocate neighbourhood of a route, in `Relocate` move order.
+
+    Each move is scored in O(1) against the current route: a move replaces at most
+    3 edges (around the removed segment, and at the insertion point), the rest of
+    the route, including the edges inside the segment, is unchanged. Hence
+    D changes by the added minus the removed distances, and the new max/min edge
+    is either an added edge or one of the 4 longest/shortest current edges.
+    Validity is tracked the same way, by counting forbidden transitions. Moves whose
+    lower bound, D plus L times the spread of the added edges, does not beat the
+    best value are discarded before the max/min lookup.
+
+    Returns:
+        (v1, v2, insert_pos) of the best (or first) improving move, all `NO_MOVE`
+        if there is none, its objective value, and the number of evaluated moves
+
+    """
+    route_length = sequence.shape[0]
+    if route_length < MIN_ROUTE_LENGTH:
+        return NO_MOVE, NO_MOVE, NO_MOVE, _route_value(sequence, distance_matrix, l_value), 0
+
+    edge_distances, nb_of_invalid, total_distance, shortest_edges, longest_edges = _route_stats(
+        sequence, distance_matrix, valid_transitions,
+    )
+    best_value = l_value * (edge_distances.max() - edge_distances.min()) + total_distance
+    best_move = (NO_MOVE, NO_MOVE, NO_MOVE)
+    evaluations = 0
+    # the last node never moves
+    if only_valid and sequence[-1] != distance_matrix.shape[0] - 1:
+        return NO_MOVE, NO_MOVE, NO_MOVE, best_value, evaluations
+
+    for v1 in range(1, route_length - 2):
+        v2, insert_pos, value, v1_evaluations = _search_from(
+            v1, sequence, distance_matrix, valid_transitions, l_value, only_valid, first_improvement,
+            edge_distances, nb_of_invalid, total_distance, shortest_edges, longest_edges, best_value,
+        )
+        evaluations += v1_evaluations
+        if v2 != NO_MOVE:
+            best_value = value
+            best_move = (v1, v2, insert_pos)
+            if first_improvement:
+                break
+
+    return best_move[0], best_move[1], best_move[2], best_value, evaluations
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def search_best_relocate_parallel_kernel(
+        sequence: np.ndarray,
+        distance_matrix: np.ndarray,
+        valid_transitions: np.ndarray,
+        l_value: float,
+        only_valid: bool,
+    ) -> tuple[int, int, int, float, int]:
+    """Search the relocate neighbourhood of a route for the best move, in parallel over `v1`.
+
+    Each segment start `v1` is searched independently against the current route's
+    value (see `search_relocate_kernel`), and keeps its own best move. The reduction
+    takes the first `v1` with the lowest value, so the result is the move the
+    sequential best-improvement search returns.
+
+    Returns:
+        (v1, v2, insert_pos) of the best improving move, all `NO_MOVE` if there is
+        none, its objective value, and the number of evaluated moves
+
+    """
+    route_length = sequence.shape[0]
+    if route_length < MIN_ROUTE_LENGTH:
+        return NO_MOVE, NO_MOVE, NO_MOVE, _route_value(sequence, distance_matrix, l_value), 0
+
+    edge_distances, nb_of_invalid, total_distance, shortest_edges, longest_edges = _route_stats(
+        sequence, distance_matrix, valid_transitions,
+    )
+    current_value = l_value * (edge_distances.max() - edge_distances.min()) + total_distance
+    # the last node never moves
+    if only_valid and sequence[-1] != distance_matrix.shape[0] - 1:
+        return NO_MOVE, NO_MOVE, NO_MOVE, current_value, 0
+
+    # one slot per segment start, index 0 is unused as the start depot never moves
+    best_values = np.full(route_length - 2, current_value)
+    best_moves = np.full((route_length - 2, 2), NO_MOVE, dtype=np.int64)
+    evaluations = np.zeros(route_length - 2, dtype=np.int64)
+    for v1 in prange(1, route_length - 2):
+        v2, insert_pos, value, v1_evaluations = _search_from(
+            v1, sequence, distance_matrix, valid_transitions, l_value, only_valid, False,
+            edge_distances, nb_of_invalid, total_distance, shortest_edges, longest_edges, current_value,
+        )
+        evaluations[v1] = v1_evaluations
+        if v2 != NO_MOVE:
+            best_values[v1] = value
+            best_moves[v1, 0] = v2
+            best_moves[v1, 1] = insert_pos
+
+    best_v1 = NO_MOVE
+    best_value = current_value
+    for v1 in range(1, route_length - 2):
+        if best_moves[v1, 0] != NO_MOVE and best_values[v1] < best_value:
+            best_v1 = v1
+            best_value = best_values[v1]
+    if best_v1 == NO_MOVE:
+        return NO_MOVE, NO_MOVE, NO_MOVE, current_value, evaluations.sum()
+    return best_v1, best_moves[best_v1, 0], best_moves[best_v1, 1], best_value, evaluations.sum()
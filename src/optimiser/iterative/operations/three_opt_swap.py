@@ -1,5 +1,7 @@
 from random import SystemRandom
 
+import numpy as np
+
 from eval.route_eval import RouteEvaluator
 from optimiser.iterative.operations.operation import Operation
 from schemas.route import Route
@@ -50,42 +52,44 @@ class ThreeOptSwap(Operation):
 
     def _get_all_reconnections(
             self,
-            segment_a: list,
-            segment_b: list,
-            segment_c: list,
-            segment_d: list,
-        ) -> list[list]:
+            segment_a: np.ndarray,
+            segment_b: np.ndarray,
+            segment_c: np.ndarray,
+            segment_d: np.ndarray,
+        ) -> list[np.ndarray]:
         """Generate all possible 3-opt reconnections.
 
         Args:
-            segment_a: First segment
-            segment_b: Second segment
-            segment_c: Third segment
-            segment_d: Fourth segment
+            segment_a: First segment of node IDs
+            segment_b: Second segment of node IDs
+            segment_c: Third segment of node IDs
+            segment_d: Fourth segment of node IDs
 
         Returns:
             List of all possible reconnections
 
         """
+        reversed_b = segment_b[::-1]
+        reversed_c = segment_c[::-1]
         reconnections = [
             # 1. Original (no change)
-            segment_a + segment_b + segment_c + segment_d,
+            (segment_a, segment_b, segment_c, segment_d),
             # 2. Reverse C (2-opt on C)
-            segment_a + segment_b + list(reversed(segment_c)) + segment_d,
+            (segment_a, segment_b, reversed_c, segment_d),
             # 3. Reverse B (2-opt on B)
-            segment_a + list(reversed(segment_b)) + segment_c + segment_d,
+            (segment_a, reversed_b, segment_c, segment_d),
             # 4. Swap B and C
-            segment_a + segment_c + segment_b + segment_d,
+            (segment_a, segment_c, segment_b, segment_d),
             # 5. Reverse both B and C
-            segment_a + list(reversed(segment_b)) + list(reversed(segment_c)) + segment_d,
+            (segment_a, reversed_b, reversed_c, segment_d),
             # 6. Swap B and C, reverse B
-            segment_a + segment_c + list(reversed(segment_b)) + segment_d,
+            (segment_a, segment_c, reversed_b, segment_d),
             # 7. Swap B and C, reverse C
-            segment_a + list(reversed(segment_c)) + segment_b + segment_d,
+            (segment_a, reversed_c, segment_b, segment_d),
             # 8. Swap and reverse both B and C
-            segment_a + list(reversed(segment_c)) + list(reversed(segment_b)) + segment_d,
+            (segment_a, reversed_c, reversed_b, segment_d),
         ]
-        return reconnections
+        return [np.concatenate(segments) for segments in reconnections]
 
     def apply(
             self,
@@ -111,7 +115,7 @@ class ThreeOptSwap(Operation):
             The modified route (either new or the same object if inplace=True)
 
         """
-        route_length = len(route.sequence)
+        route_length = len(route)
 
         # Need at least 6 nodes to perform 3-opt (start, 3 intermediate segments, end)
         if route_length < MIN_ROUTE_LENGTH:
@@ -144,16 +148,17 @@ class ThreeOptSwap(Operation):
             self.logger.error(f"Invalid reconnection_type: {reconnection_type}, must be 0-7")
             return route if inplace else route.copy()
 
-        self.logger.debug(
-            f"Applying 3-opt swap at indices [{v1}, {v2}, {v3}] "
-            f"with reconnection type {reconnection_type}",
-        )
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(
+                f"Applying 3-opt swap at indices [{v1}, {v2}, {v3}] "
+                f"with reconnection type {reconnection_type}",
+            )
 
         # Extract segments
-        segment_a = route.sequence[:v1]
-        segment_b = route.sequence[v1:v2]
-        segment_c = route.sequence[v2:v3]
-        segment_d = route.sequence[v3:]
+        segment_a = route.ids[:v1]
+        segment_b = route.ids[v1:v2]
+        segment_c = route.ids[v2:v3]
+        segment_d = route.ids[v3:]
 
         # Get all possible reconnections
         all_reconnections = self._get_all_reconnections(
@@ -161,23 +166,25 @@ class ThreeOptSwap(Operation):
         )
 
         # Select the desired reconnection
-        new_sequence = all_reconnections[reconnection_type]
+        new_ids = all_reconnections[reconnection_type]
 
         # Apply the change
         if inplace:
-            route.sequence = new_sequence
-            self.logger.debug(
-                f"Applied 3-opt swap in place at indices [{v1}, {v2}, {v3}] "
-                f"type {reconnection_type}",
-            )
+            route.ids = new_ids
+            if self.logger.is_enabled_for("DEBUG"):
+                self.logger.debug(
+                    f"Applied 3-opt swap in place at indices [{v1}, {v2}, {v3}] "
+                    f"type {reconnection_type}",
+                )
             return route
 
         # Create a new route
-        new_route = Route(name=route.name, sequence=new_sequence, logger=self.logger)
-        self.logger.debug(
-            f"Created new route with 3-opt swap at indices [{v1}, {v2}, {v3}] "
-            f"type {reconnection_type}",
-        )
+        new_route = route.with_ids(new_ids, copy=False)
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(
+                f"Created new route with 3-opt swap at indices [{v1}, {v2}, {v3}] "
+                f"type {reconnection_type}",
+            )
         return new_route
 
     def apply_best_improvement(
@@ -201,7 +208,7 @@ class ThreeOptSwap(Operation):
         orig_value = best_value = self.route_eval.calculate_objective_value(route)
         improved = False
 
-        route_length = len(route.sequence)
+        route_length = len(route)
         evaluations = 0
 
         # Try all possible 3-opt swaps
@@ -229,10 +236,11 @@ class ThreeOptSwap(Operation):
                             best_route = new_route
                             best_value = new_value
                             improved = True
-                            self.logger.debug(
-                                f"Found improvement with 3-opt [{v1}, {v2}, {v3}] "
-                                f"type {reconnection_type}: value reduced to {new_value:.2f}",
-                            )
+                            if self.logger.is_enabled_for("DEBUG"):
+                                self.logger.debug(
+                                    f"Found improvement with 3-opt [{v1}, {v2}, {v3}] "
+                                    f"type {reconnection_type}: value reduced to {new_value:.2f}",
+                                )
 
         if improved:
             self.logger.info(
@@ -264,7 +272,7 @@ class ThreeOptSwap(Operation):
 
         """
         curr_value = self.route_eval.calculate_objective_value(route)
-        route_length = len(route.sequence)
+        route_length = len(route)
         evaluations = 0
 
         # Try 3-opt swaps until we find an improvement
@@ -1,5 +1,7 @@
 from random import SystemRandom
 
+import numpy as np
+
 from eval.route_eval import RouteEvaluator
 from optimiser.iterative.operations.operation import Operation
 from schemas.route import Route
@@ -58,7 +60,7 @@ class TwoOptSwap(Operation):
             The modified route (either new or the same object if inplace=True)
 
         """
-        route_length = len(route.sequence)
+        route_length = len(route)
 
         # Need at least 4 nodes to perform 2-opt (start, 2 intermediate, end)
         if route_length < MIN_ROUTE_LENGTH:
@@ -82,27 +84,30 @@ class TwoOptSwap(Operation):
                 )
                 return route if inplace else route.copy()
 
-        self.logger.debug(
-            f"Applying 2-opt swap: reversing segment between indices {v1} and {v2}",
-        )
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(
+                f"Applying 2-opt swap: reversing segment between indices {v1} and {v2}",
+            )
 
         # Perform the 2-opt swap
         if inplace:
             # Reverse the segment in place
-            route.sequence[v1:v2 + 1] = reversed(route.sequence[v1:v2 + 1])
-            self.logger.debug(f"Applied 2-opt swap in place at indices [{v1}:{v2}]")
+            route.ids = np.concatenate((route.ids[:v1], route.ids[v1:v2 + 1][::-1], route.ids[v2 + 1:]))
+            if self.logger.is_enabled_for("DEBUG"):
+                self.logger.debug(f"Applied 2-opt swap in place at indices [{v1}:{v2}]")
             return route
 
         # else: Create a new route with the reversed segment
-        new_sequence = (
-            route.sequence[:v1] +  # Keep first part as is
-            list(reversed(route.sequence[v1:v2 + 1])) +  # Reverse middle segment
-            route.sequence[v2 + 1:]  # Keep last part as is
-        )
-        new_route = Route(name=route.name, sequence=new_sequence, logger=self.logger)
-        self.logger.debug(
-            f"Created new route with 2-opt swap at indices [{v1}:{v2}]",
-        )
+        new_ids = np.concatenate((
+            route.ids[:v1],  # Keep first part as is
+            route.ids[v1:v2 + 1][::-1],  # Reverse middle segment
+            route.ids[v2 + 1:],  # Keep last part as is
+        ))
+        new_route = route.with_ids(new_ids, copy=False)
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(
+                f"Created new route with 2-opt swap at indices [{v1}:{v2}]",
+            )
         return new_route
 
     def apply_best_improvement(
@@ -126,7 +131,7 @@ class TwoOptSwap(Operation):
         orig_value = best_value = self.route_eval.calculate_objective_value(route)
         improved = False
 
-        route_length = len(route.sequence)
+        route_length = len(route)
 
         # Try all possible 2-opt swaps
         for v1 in range(1, route_length - 2):
@@ -142,10 +147,11 @@ class TwoOptSwap(Operation):
                     best_route = new_route
                     best_value = new_value
                     improved = True
-                    self.logger.debug(
-                        f"Found improvement with 2-opt [{v1}:{v2}]: "
-                        f"value reduced to {new_value:.2f}",
-                    )
+                    if self.logger.is_enabled_for("DEBUG"):
+                        self.logger.debug(
+                            f"Found improvement with 2-opt [{v1}:{v2}]: "
+                            f"value reduced to {new_value:.2f}",
+                        )
 
         if improved:
             self.logger.info(
@@ -175,7 +181,7 @@ class TwoOptSwap(Operation):
 
         """
         curr_value = self.route_eval.calculate_objective_value(route)
-        route_length = len(route.sequence)
+        route_length = len(route)
 
         # Try 2-opt swaps until we find an improvement
         for v1 in range(1, route_length - 2):
@@ -153,7 +153,7 @@ class SimulatedAnnealingImprover(IterativeOptimiser):
         current_route = None
 
         for route in self.seed_routes:
-            self.logger.debug(f"Seed route with {len(route.sequence)} nodes.")
+            self.logger.debug(f"Seed route with {len(route)} nodes.")
             route_value = self.route_eval.calculate_objective_value(route=route)
             if route_value < best_route_value:
                 best_route_value = route_value
@@ -1,15 +1,24 @@
 import matplotlib.pyplot as plt
+import numpy as np
 
+from datastore.node_manager import NodeManager
 from schemas.node import Node
 from schemas.route import Route
 from utils.logger import Logger
 
 
 class IterationPlotBuilder:
-    """Builder class for plotting iteration statistics."""
+    """Builder class for plotting iteration statistics.
+
+    The figure and its lines are created once, and only their data is replaced per plot.
+    Call `close` when done plotting, to release the figure.
+    """
 
     logger: Logger
     figure: plt.Figure
+    axes: plt.Axes
+    current_line: plt.Line2D
+    best_line: plt.Line2D
 
     def __init__(
             self,
@@ -17,7 +26,13 @@ class IterationPlotBuilder:
         ) -> None:
         """Initialize the PlotBuilder."""
         self.logger = logger or Logger(__name__)
-        self.figure = plt.figure(figsize=(10, 6))
+        self.figure, self.axes = plt.subplots(figsize=(10, 6))
+        (self.current_line,) = self.axes.plot([], [], label="Current Value", color="blue")
+        (self.best_line,) = self.axes.plot([], [], label="Best Value", color="green")
+        self.axes.set_xlabel("Iteration (#)")
+        self.axes.set_ylabel("Objective Value")
+        self.axes.legend()
+        self.axes.grid()
 
     def iterations_to_file(
             self,
@@ -26,7 +41,6 @@ class IterationPlotBuilder:
             title: str | None = None,
         ) -> plt.Figure:
         """Rebuild the plot builder."""
-        self._clear_plot()
         self._plot_iterations(iterations=iterations)
         self._save_plot(
             filepath=filepath,
@@ -34,22 +48,17 @@ class IterationPlotBuilder:
         )
         return self
 
-    def _clear_plot(self) -> None:
-        """Clear the current plot."""
-        plt.clf()
-
     def _plot_iterations(self, iterations: list[dict]) -> None:
         """Plot the iteration statistics."""
-        iteration_nums = [item["iteration"] for item in iterations]
-        current_values = [item["current_value"] for item in iterations]
-        best_values = [item["best_value"] for item in iterations]
+        count = len(iterations)
+        iteration_nums = np.fromiter((item["iteration"] for item in iterations), dtype=np.int64, count=count)
+        current_values = np.fromiter((item["current_value"] for item in iterations), dtype=np.float64, count=count)
+        best_values = np.fromiter((item["best_value"] for item in iterations), dtype=np.float64, count=count)
 
-        plt.plot(iteration_nums, current_values, label="Current Value", color="blue")
-        plt.plot(iteration_nums, best_values, label="Best Value", color="green")
-        plt.xlabel("Iteration (#)")
-        plt.ylabel("Objective Value")
-        plt.legend()
-        plt.grid()
+        self.current_line.set_data(iteration_nums, current_values)
+        self.best_line.set_data(iteration_nums, best_values)
+        self.axes.relim()
+        self.axes.autoscale_view()
 
     def _save_plot(
             self,
@@ -58,16 +67,27 @@ class IterationPlotBuilder:
         ) -> None:
         """Save the plot to the specified filepath."""
         title = title or "Iteration Statistics"
-        plt.title(title)
-        plt.savefig(filepath)
-        plt.close()
+        self.axes.set_title(title)
+        self.figure.savefig(filepath)
+
+    def close(self) -> None:
+        """Close the figure, the builder cannot plot afterwards."""
+        plt.close(self.figure)
+
 
 class RoutePlotBuilder:
-    """Builder class for plotting routes."""
+    """Builder class for plotting routes.
+
+    The figure and the nodes are drawn once, and only the route line is replaced per plot.
+    Call `close` when done plotting, to release the figure.
+    """
 
     logger: Logger
     figure: plt.Figure
+    axes: plt.Axes
+    route_line: plt.Line2D
     nodes: list[Node]
+    coords: np.ndarray
 
     def __init__(
             self,
@@ -76,8 +96,14 @@ class RoutePlotBuilder:
         ) -> None:
         """Initialize the PlotBuilder."""
         self.nodes = nodes
+        self.coords = NodeManager.coords_of(nodes)
         self.logger = logger or Logger(__name__)
-        self.figure = plt.figure(figsize=(10, 6))
+        self.figure, self.axes = plt.subplots(figsize=(10, 6))
+        self._plot_nodes()
+        (self.route_line,) = self.axes.plot([], [], color="red", marker="o")
+        self.axes.set_xlabel("X Coordinate")
+        self.axes.set_ylabel("Y Coordinate")
+        self.axes.grid()
 
     def route_to_file(
             self,
@@ -86,8 +112,6 @@ class RoutePlotBuilder:
             title: str | None = None,
         ) -> plt.Figure:
         """Rebuild the plot builder."""
-        self._clear_plot()
-        self._plot_nodes()
         self._plot_route(route=route)
         self._save_plot(
             filepath=filepath,
@@ -95,25 +119,16 @@ class RoutePlotBuilder:
         )
         return self
 
-    def _clear_plot(self) -> None:
-        """Clear the current plot."""
-        plt.clf()
-
     def _plot_nodes(self) -> None:
         """Plot the nodes."""
-        x_coords = [node.x for node in self.nodes]
-        y_coords = [node.y for node in self.nodes]
-
-        plt.scatter(x_coords, y_coords, color="blue")
-        for i, node in enumerate(self.nodes):
-            plt.text(node.x, node.y, str(node.id))
+        self.axes.scatter(self.coords[:, 0], self.coords[:, 1], color="blue")
+        for node in self.nodes:
+            self.axes.text(node.x, node.y, str(node.id))
 
     def _plot_route(self, route: Route) -> None:
         """Plot the given route."""
-        x_coords = [node.x for node in route.sequence]
-        y_coords = [node.y for node in route.sequence]
-
-        plt.plot(x_coords, y_coords, color="red", marker="o")
+        route_coords = self.coords[route.ids]
+        self.route_line.set_data(route_coords[:, 0], route_coords[:, 1])
 
     def _save_plot(
             self,
@@ -122,9 +137,9 @@ class RoutePlotBuilder:
         ) -> None:
         """Save the plot to the specified filepath."""
         title = title or "Route Plot"
-        plt.title(title)
-        plt.xlabel("X Coordinate")
-        plt.ylabel("Y Coordinate")
-        plt.grid()
-        plt.savefig(filepath)
-        plt.close()
+        self.axes.set_title(title)
+        self.figure.savefig(filepath)
+
+    def close(self) -> None:
+        """Close the figure, the builder cannot plot afterwards."""
+        plt.close(self.figure)
@@ -38,13 +38,12 @@ class RouteExporter:
         ```
         """
         total_distance, distances = self.route_eval.total_distance_and_distances(route=route)
-        max_distance = max(distances) if distances else 0.0
-        min_distance = min(distances) if distances else 0.0
+        max_distance = float(distances.max()) if distances.size else 0.0
+        min_distance = float(distances.min()) if distances.size else 0.0
         delta = max_distance - min_distance
 
-        route_sequence_ids = "-".join([str(node.id) for node in route.sequence])
         return (
-            f"Route:{route_sequence_ids}\n"
+            f"Route:{route}\n"
             f"Total Distance: {total_distance:.2f}\n"
             f"Delta Value: {delta:.2f}"
         )
@@ -66,3 +65,7 @@ class RouteExporter:
             filepath=filepath,
             title=title,
         )
+
+    def close(self) -> None:
+        """Close the route plot figure."""
+        self.plot_plot_builder.close()
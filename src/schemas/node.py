@@ -1,20 +1,19 @@
-from pydantic import BaseModel, ConfigDict
+from dataclasses import dataclass
 
 
-class Node(BaseModel):
-    """A node."""
+@dataclass(slots=True, frozen=True)
+class Node:
+    """A node.
 
-    model_config = ConfigDict(frozen=True)
+    Equality and hashing are based on the node id, x, and y coordinates.
+    """
 
     id: int
     x: float
     y: float
 
-    def __hash__(self) -> int:
-        """Make Node hashable for use in sets and dicts.
-
-        Returns:
-            Hash value based on node id, x, and y coordinates
-
-        """
-        return hash((self.id, self.x, self.y))
+    def __post_init__(self) -> None:
+        """Coerce the fields to their declared types, e.g. IDs parsed as strings."""
+        object.__setattr__(self, "id", int(self.id))
+        object.__setattr__(self, "x", float(self.x))
+        object.__setattr__(self, "y", float(self.y))
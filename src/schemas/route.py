@@ -1,13 +1,112 @@
-from pydantic import BaseModel
+import numpy as np
 
 from schemas.node import Node
 
 
-class Route(BaseModel):
-    """A class representing a route consisting of multiple nodes."""
+class Route:
+    """A class representing a route consisting of multiple nodes.
+
+    The route is held as an array of node IDs, in visiting order. The nodes
+    themselves live in a node table indexed by node ID, which is shared by
+    the routes derived from each other (copies, operation results).
+
+    `edge_distances` and `objective_value` cache the evaluation of the route
+    (see `RouteEvaluator`) and are reset whenever `ids` or `sequence` is assigned.
+    Do not modify `ids` in place, as that bypasses the reset.
+    """
 
     name: str
-    sequence: list[Node]
+    node_table: list[Node]
+    edge_distances: np.ndarray | None
+    objective_value: float | None
+    _ids: np.ndarray
+    _sequence: list[Node] | None
+
+    def __init__(
+            self,
+            name: str = "",
+            sequence: list[Node] | None = None,
+            *,
+            ids: np.ndarray | None = None,
+            node_table: list[Node] | None = None,
+            copy: bool = True,
+        ) -> None:
+        """Initialize the route from a node sequence, or from node IDs and a node table.
+
+        Args:
+            name: Name of the route
+            sequence: Nodes in visiting order
+            ids: Node IDs in visiting order, used if `sequence` is None
+            node_table: Nodes indexed by node ID, required with `ids`
+            copy: If False, take over `ids` without copying it (when it is already an int32 array),
+                the caller must not modify it afterwards
+
+        """
+        self.name = name
+        self.edge_distances = None
+        self.objective_value = None
+        if sequence is None and ids is not None:
+            if node_table is None:
+                msg = "A node table is required to create a route from node IDs"
+                raise ValueError(msg)
+            self.node_table = node_table
+            self._ids = np.array(ids, dtype=np.int32) if copy else np.asarray(ids, dtype=np.int32)
+            self._sequence = None
+            return
+
+        sequence = list(sequence or [])
+        self.node_table = node_table if node_table is not None else self._node_table_of(sequence)
+        self._ids = self._ids_of(sequence)
+        self._sequence = sequence
+
+    @staticmethod
+    def _ids_of(sequence: list[Node]) -> np.ndarray:
+        """Get the node IDs of a node sequence as an array."""
+        return np.fromiter((node.id for node in sequence), dtype=np.int32, count=len(sequence))
+
+    @staticmethod
+    def _node_table_of(sequence: list[Node]) -> list[Node]:
+        """Index the nodes of a node sequence by node ID."""
+        node_table = [None] * (max((node.id for node in sequence), default=-1) + 1)
+        for node in sequence:
+            node_table[node.id] = node
+        return node_table
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Get the node IDs of the route, in visiting order."""
+        return self._ids
+
+    @ids.setter
+    def ids(self, ids: np.ndarray) -> None:
+        self._ids = np.asarray(ids, dtype=np.int32)
+        self._sequence = None
+        self._reset_evaluation()
+
+    @property
+    def sequence(self) -> list[Node]:
+        """Get the nodes of the route, in visiting order.
+
+        The list is materialised on first access, prefer `ids` in hot paths.
+        """
+        if self._sequence is None:
+            self._sequence = [self.node_table[node_id] for node_id in self._ids.tolist()]
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, sequence: list[Node]) -> None:
+        sequence = list(sequence)
+        if any(node.id >= len(self.node_table) or self.node_table[node.id] is None for node in sequence):
+            known_nodes = [node for node in self.node_table if node is not None]
+            self.node_table = self._node_table_of([*known_nodes, *sequence])
+        self._ids = self._ids_of(sequence)
+        self._sequence = sequence
+        self._reset_evaluation()
+
+    def _reset_evaluation(self) -> None:
+        """Drop the cached evaluation, after the visit order changed."""
+        self.edge_distances = None
+        self.objective_value = None
 
     def __str__(self) -> str:
         """Get the route as a string representation.
@@ -16,7 +115,7 @@ class Route(BaseModel):
             String in format "0-3-1-2-4-5"
 
         """
-        return "-".join([str(node.id) for node in self.sequence])
+        return "-".join([str(node_id) for node_id in self._ids.tolist()])
 
     def __repr__(self) -> str:
         """Representation the route as a string."""
@@ -24,8 +123,21 @@ class Route(BaseModel):
 
     def __len__(self) -> int:
         """Return the number of nodes in the route."""
-        return len(self.sequence)
+        return len(self._ids)
 
     def copy(self) -> "Route":
-        """Create a deep copy of the route."""
-        return Route(name=self.name, sequence=self.sequence.copy())
+        """Create a deep copy of the route.
+
+        The cached evaluation is kept, since the visit order is the same.
+        """
+        route = self.with_ids(self._ids.copy(), copy=False)
+        route.edge_distances = self.edge_distances
+        route.objective_value = self.objective_value
+        return route
+
+    def with_ids(self, ids: np.ndarray, *, copy: bool = True) -> "Route":
+        """Create a route with the same name and node table, visiting the nodes `ids`.
+
+        With `copy=False`, `ids` is taken over as is, see `Route.__init__`.
+        """
+        return Route(name=self.name, ids=ids, node_table=self.node_table, copy=copy)
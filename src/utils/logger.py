@@ -1,12 +1,222 @@
 """Logging module."""
 
+import atexit
+import copy
 import json
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from contextvars import ContextVar, Token
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from typing import Any, ClassVar, Literal
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import IO, Any, ClassVar, Literal
+
+FILE_BUFFER_SIZE = 1 << 16  # 64 KiB
+FSYNC_INTERVAL = 1.0  # seconds
+DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON serialisation
+    orjson = None
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialise a log record dict (or a value of it) to compact JSON, with orjson if available.
+
+    Values that are not JSON serialisable are converted with `str`.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for a listener thread of the same process.
+
+    Unlike `QueueHandler`, the records are not formatted to text when enqueued, only
+    their message is merged with its arguments, so that the formatter of the listener's
+    handler still sees the exception info (e.g. for the JSON "exception" field).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message and its arguments, on a copy of the record."""
+        if not record.args and type(record.msg) is str:
+            return record  # nothing to merge
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that tracks the file size with a counter.
+
+    `RotatingFileHandler` seeks to the end of the file and calls `tell()` before every
+    record, and formats each record twice (for the size check, and for the write).
+    This handler formats once and adds the encoded size of each record to a counter.
+
+    With `buffered=True`, the file is opened as a raw append-only descriptor, and the
+    encoded records are collected in a `FILE_BUFFER_SIZE` bytes buffer, written with
+    `os.write` once full or on `flush()`, which the owner is responsible for calling.
+    A flush also syncs the file to disk, at most every `FSYNC_INTERVAL` seconds.
+    """
+
+    buffered: bool
+    _bytes_written: int
+    _buffer: bytearray
+    _last_fsync: float
+
+    def __init__(self, filename: str, *args, buffered: bool = False, **kwargs) -> None:
+        """Initialize the handler, counting the size of an existing log file."""
+        self.buffered = buffered
+        self._buffer = bytearray()
+        self._last_fsync = time.monotonic()
+        super().__init__(filename, *args, **kwargs)
+        self._bytes_written = self._file_size()
+
+    def _open(self) -> IO:
+        """Open the log file, as an unbuffered binary file appending to a raw descriptor if buffered."""
+        if not self.buffered:
+            return super()._open()
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return os.fdopen(fd, "wb", buffering=0)
+
+    def _file_size(self) -> int:
+        """Get the current size of the log file, 0 if it does not exist."""
+        return os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def _encode(self, msg: str) -> bytes:
+        """Encode `msg` as it is written to the log file."""
+        return msg.encode(self.encoding or "utf-8", errors=self.errors or "strict")
+
+    def _encoded_size(self, msg: str) -> int:
+        """Get the number of bytes `msg` takes in the log file."""
+        return len(self._encode(msg))
+
+    def _should_rollover(self, size: int) -> bool:
+        """Check if writing `size` more bytes reaches `maxBytes`."""
+        return 0 < self.maxBytes <= self._bytes_written + size
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check if writing the record reaches `maxBytes`, without touching the file."""
+        return self._should_rollover(self._encoded_size(self.format(record) + self.terminator))
+
+    def doRollover(self) -> None:
+        """Rotate the log files, and restart the counter."""
+        self._write_buffer()
+        super().doRollover()
+        self._bytes_written = self._file_size()
+
+    def _write_buffer(self) -> None:
+        """Write the buffered records to the log file, and empty the buffer."""
+        if not self._buffer or self.stream is None:
+            return
+        fd = self.stream.fileno()
+        data = memoryview(self._buffer)
+        while data:
+            data = data[os.write(fd, data):]
+        data.release()
+        self._buffer.clear()
+
+    def flush(self) -> None:
+        """Write the buffered records, and sync them to disk if the last sync is old enough."""
+        if not self.buffered:
+            super().flush()
+            return
+        with self.lock:
+            if self.stream is None:
+                return
+            self._write_buffer()
+            now = time.monotonic()
+            if now - self._last_fsync >= FSYNC_INTERVAL:
+                os.fsync(self.stream.fileno())
+                self._last_fsync = now
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, rotating the log files first if it would reach `maxBytes`."""
+        try:
+            msg = self.format(record) + self.terminator
+            data = self._encode(msg)
+            if self._should_rollover(len(data)):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            if self.buffered:
+                self._buffer += data
+                if len(self._buffer) >= FILE_BUFFER_SIZE:
+                    self._write_buffer()
+            else:
+                self.stream.write(msg)
+                self.flush()
+            self._bytes_written += len(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs empty.
+
+    Buffered handlers then write a burst of records with few system calls,
+    while no record waits in a buffer once the logger is idle.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Get the next record, flushing the handlers first if there is none yet."""
+        try:
+            return self.queue.get(block=False)
+        except queue.Empty:
+            if not block:
+                raise
+        for handler in self.handlers:
+            handler.flush()
+        return self.queue.get(block=True)
+
+
+# Log level mapping
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+_LEVELS_GET = _LEVELS.get
+_LEVEL_NAMES = {number: name for name, number in _LEVELS.items()}
+
+
+def _level_number(level: str | int) -> int | None:
+    """Get the number of a log level given by name (any case) or number, None if unknown."""
+    if isinstance(level, int):
+        return level if level in _LEVEL_NAMES else None
+    # upper-case names, the usual spelling, skip the case conversion
+    return _LEVELS_GET(level) or _LEVELS_GET(level.upper())
+
+
+# output configuration of the loggers set up by `Logger`, and the instance that set it up, by name
+_CONFIGURED: dict[str, tuple[tuple, "Logger"]] = {}
+
+# background listeners writing the file output, by logger name
+_LISTENERS: dict[str, QueueListener] = {}
+
+# log file directories already created (or found existing) by `Logger`
+_CREATED_DIRS: set[str] = set()
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Drain and stop the file output listeners, so no queued record is lost at exit."""
+    for listener in list(_LISTENERS.values()):
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+    _LISTENERS.clear()
 
 
 class Logger:
@@ -15,38 +225,33 @@ class Logger:
     Features:
     - Multiple log levels (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - Console (stdout/stderr) output
-    - File output with rotation
+    - File output with rotation, written by a background thread
     - JSON formatting option
     - Context management support
     - Thread-safe operations
     """
 
-    # Log level mapping
-    LEVELS: ClassVar = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
+    # Log level mapping, kept for backward compatibility
+    LEVELS: ClassVar = _LEVELS
 
     def __init__(
         self,
         name: str,
-        level: str = "INFO",
+        level: str | int = "INFO",
         *,
         console_output: bool = True,
         file_output: str | None = None,
         json_format: bool = False,
         max_bytes: int = 10485760,  # 10MB
         backup_count: int = 5,
-        date_format: str = "%Y-%m-%d %H:%M:%S",
+        date_format: str = DEFAULT_DATE_FORMAT,
     ) -> None:
         """Initialize the logger.
 
         Args:
             name: Logger name (typically __name__ of the module)
-            level: Minimum log level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+            level: Minimum log level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'),
+                or its `logging` number
             console_output: Enable console output to stdout
             file_output: Path to log file (None to disable file logging)
             json_format: Use JSON format for log messages
@@ -56,13 +261,28 @@ class Logger:
 
         """
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(self.LEVELS.get(level.upper(), logging.INFO))
         self.logger.propagate = False
         self.json_format = json_format
         self.date_format = date_format
-
-        # Remove existing handlers
+        self._listener = None
+        self._queue_handler = None
+
+        # Reuse the handlers if the logger is already set up with the same output configuration
+        config = (console_output, file_output, json_format, max_bytes, backup_count, date_format)
+        configured = _CONFIGURED.get(name)
+        if configured is not None and configured[0] == config:
+            self._listener = configured[1]._listener
+            self._queue_handler = configured[1]._queue_handler
+            self._apply_level(_level_number(level) or logging.INFO)
+            return
+        self.logger.setLevel(_level_number(level) or logging.INFO)
+
+        # Remove existing handlers, releasing their streams and the file output thread
+        for handler in self.logger.handlers:
+            handler.close()
         self.logger.handlers.clear()
+        self._stop_listener(name)
+        _CONFIGURED[name] = (config, self)
 
         # Add console handler
         if console_output:
@@ -80,70 +300,131 @@ class Logger:
         self.logger.addHandler(console_handler)
 
     def _add_file_handler(self, filepath: str, max_bytes: int, backup_count: int) -> None:
-        """Add rotating file handler."""
-        # Ensure directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        """Add rotating file handler.
 
-        file_handler = RotatingFileHandler(
+        The logger only enqueues the records, a `QueueListener` thread formats and
+        writes them, so that disk writes and rollovers do not block the caller.
+        """
+        # Ensure directory exists, once per directory
+        parent = os.path.dirname(filepath)
+        if parent and parent not in _CREATED_DIRS:
+            os.makedirs(parent, exist_ok=True)
+            _CREATED_DIRS.add(parent)
+
+        file_handler = FastRotatingFileHandler(
             filepath,
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding="utf-8",
+            buffered=True,
         )
         file_handler.setLevel(self.logger.level)
         file_handler.setFormatter(self._get_formatter())
-        self.logger.addHandler(file_handler)
+
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = _LocalQueueHandler(log_queue)
+        self._queue_handler.setLevel(self.logger.level)
+        self.logger.addHandler(self._queue_handler)
+        self._listener = _FlushingQueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        _LISTENERS[self.logger.name] = self._listener
+
+    @staticmethod
+    def _stop_listener(name: str) -> None:
+        """Stop the file output listener of the logger `name`, if any, and close its files."""
+        listener = _LISTENERS.pop(name, None)
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    def close(self) -> None:
+        """Write the queued records, and close the file output, if any.
+
+        Only the instance that set the handlers up closes them, instances reusing
+        them only let go of them, and the owner keeps logging.
+        """
+        configured = _CONFIGURED.get(self.logger.name)
+        if configured is not None and configured[1] is self:
+            if self._queue_handler is not None:
+                self.logger.removeHandler(self._queue_handler)
+            if self._listener is not None and _LISTENERS.get(self.logger.name) is self._listener:
+                self._stop_listener(self.logger.name)
+                _CONFIGURED.pop(self.logger.name, None)  # the next instance sets the file output up again
+        self._listener = None
+        self._queue_handler = None
 
     def _get_formatter(self) -> logging.Formatter:
-        """Get appropriate formatter based on configuration."""
-        if self.json_format:
-            return JsonFormatter(self.date_format)
-        format_string = (
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(filename)s:%(lineno)d - %(message)s"
-        )
-        return logging.Formatter(format_string, datefmt=self.date_format)
+        """Get appropriate formatter based on configuration.
+
+        Formatters are shared by all handlers with the same configuration.
+        """
+        formatters = _JSON_FORMATTERS if self.json_format else _TEXT_FORMATTERS
+        formatter = formatters.get(self.date_format)
+        if formatter is None:
+            if self.json_format:
+                formatter = JsonFormatter(self.date_format)
+            else:
+                formatter = logging.Formatter(_TEXT_FORMAT, datefmt=self.date_format)
+            formatters[self.date_format] = formatter
+        return formatter
+
+    # The methods below skip the call into `logging` when the level of the logger
+    # excludes the message. `Logger` always sets an explicit level, so that check is
+    # one attribute load; `logging.Logger` then still applies its full check.
 
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
-        self.logger.debug(message, extra=kwargs)
+        if self.logger.level <= logging.DEBUG:
+            self.logger.debug(message, extra=kwargs or None)
 
     def info(self, message: str, **kwargs) -> None:
         """Log info message."""
-        self.logger.info(message, extra=kwargs)
+        if self.logger.level <= logging.INFO:
+            self.logger.info(message, extra=kwargs or None)
 
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message."""
-        self.logger.warning(message, extra=kwargs)
+        if self.logger.level <= logging.WARNING:
+            self.logger.warning(message, extra=kwargs or None)
 
     def error(self, message: str, exc_info: bool = False, **kwargs) -> None:
         """Log error message."""
-        self.logger.error(message, exc_info=exc_info, extra=kwargs)
+        if self.logger.level <= logging.ERROR:
+            self.logger.error(message, exc_info=exc_info, extra=kwargs or None)
 
     def critical(self, message: str, exc_info: bool = False, **kwargs) -> None:
         """Log critical message."""
-        self.logger.critical(message, exc_info=exc_info, extra=kwargs)
+        if self.logger.level <= logging.CRITICAL:
+            self.logger.critical(message, exc_info=exc_info, extra=kwargs or None)
 
     def exception(self, message: str, **kwargs) -> None:
         """Log exception with traceback."""
-        self.logger.exception(message, extra=kwargs)
+        if self.logger.level <= logging.ERROR:
+            self.logger.exception(message, extra=kwargs or None)
 
     def set_level(
             self,
-            level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+            level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | int,
         ) -> None:
         """Change the logging level dynamically."""
-        if level.upper() not in self.LEVELS:
-            available = ", ".join(self.LEVELS.keys())
+        new_level = _level_number(level)
+        if new_level is None:
+            available = ", ".join(_LEVELS.keys())
             msg = f"Invalid log level '{level}'. Must be one of: {available}"
             raise ValueError(msg)
 
-        new_level = self.LEVELS[level.upper()]
-        self.logger.setLevel(new_level)
-        for handler in self.logger.handlers:
-            handler.setLevel(new_level)
+        self._apply_level(new_level)
+
+        self.info(f"Log level changed to {_LEVEL_NAMES[new_level]}")
 
-        self.info(f"Log level changed to {level.upper()}")
+    def _apply_level(self, level: int) -> None:
+        """Set the level of the logger and of all its handlers."""
+        self.logger.setLevel(level)
+        listener_handlers = self._listener.handlers if self._listener is not None else ()
+        for handler in [*self.logger.handlers, *listener_handlers]:
+            handler.setLevel(level)
 
     def get_level(self) -> str:
         """Get the current logging level.
@@ -152,11 +433,23 @@ class Logger:
             Current log level as string (e.g., 'INFO', 'DEBUG')
 
         """
-        level_num = self.logger.level
-        for name, num in self.LEVELS.items():
-            if num == level_num:
-                return name
-        return "NOTSET"
+        return _LEVEL_NAMES.get(self.logger.level, "NOTSET")
+
+    def is_enabled_for(
+            self,
+            level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | int,
+        ) -> bool:
+        """Check if a message at `level` would be logged.
+
+        Guard expensive message construction (e.g. f-strings in hot loops) with it,
+        as the arguments of `debug(...)` are evaluated even when the message is discarded.
+        """
+        level_number = _level_number(level)
+        if level_number is None:
+            available = ", ".join(_LEVELS.keys())
+            msg = f"Invalid log level '{level}'. Must be one of: {available}"
+            raise ValueError(msg)
+        return self.logger.isEnabledFor(level_number)
 
     @property
     def level(self) -> str:
@@ -179,19 +472,73 @@ class Logger:
 
 
 class JsonFormatter(logging.Formatter):
-    """Custom JSON formatter for structured logging."""
+    """Custom JSON formatter for structured logging.
+
+    Records without exception info or extra fields, the common case, are written
+    with a string template instead of building and serialising a dict.
+    """
+
+    dumps: ClassVar = staticmethod(_json_dumps)
 
     def __init__(self, date_format: str):
         super().__init__()
         self.date_format = date_format
+        # JSON strings of the logger, level, module and function names, which repeat
+        self._quoted: dict[str | None, str] = {}
+        # sub-second directives need a datetime, otherwise the timestamp only changes every second
+        self._cache_timestamp = "%f" not in date_format
+        self._last_timestamp = (-1, "")  # (second, formatted), swapped as one tuple
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format the record creation time, once per second of log records."""
+        if not self._cache_timestamp:
+            return datetime.fromtimestamp(created).strftime(self.date_format)
+        second = int(created)
+        last_second, last_timestamp = self._last_timestamp
+        if second != last_second:
+            last_timestamp = time.strftime(self.date_format, time.localtime(second))
+            self._last_timestamp = (second, last_timestamp)
+        return last_timestamp
+
+    def _quote(self, value: str | None) -> str:
+        """Get the JSON string of a name, serialised once per name."""
+        quoted = self._quoted.get(value)
+        if quoted is None:
+            quoted = self._quoted[value] = self.dumps(value)
+        return quoted
+
+    @staticmethod
+    def _message(record: logging.LogRecord) -> str:
+        """Get the message of the record, merging the arguments only if there are any."""
+        msg = record.msg
+        if not record.args and type(msg) is str:
+            return msg
+        return record.getMessage()
+
+    def _format_template(self, record: logging.LogRecord) -> str:
+        """Format a record without exception info or extra fields as JSON, same as `format`."""
+        quote = self._quote
+        return (
+            f'{{"timestamp":{self.dumps(self._format_timestamp(record.created))},'
+            f'"level":{quote(record.levelname)},'
+            f'"logger":{quote(record.name)},'
+            f'"message":{self.dumps(self._message(record))},'
+            f'"module":{quote(record.module)},'
+            f'"function":{quote(record.funcName)},'
+            f'"line":{self.dumps(record.lineno)}}}'
+        )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        extra_fields = record.__dict__.get("extra_fields")
+        if not record.exc_info and not extra_fields:
+            return self._format_template(record)
+
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).strftime(self.date_format),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": self._message(record),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -202,39 +549,67 @@ class JsonFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+        if extra_fields:
+            log_data.update(extra_fields)
+
+        return self.dumps(log_data)
+
 
-        return json.dumps(log_data)
+# formatters by date format, shared by the handlers of all loggers
+_TEXT_FORMATTERS: dict[str, logging.Formatter] = {}
+_JSON_FORMATTERS: dict[str, JsonFormatter] = {}
+
+
+# context data of the current thread / task, merged over the enclosing contexts, never mutated
+_CONTEXT: ContextVar[dict[str, Any] | None] = ContextVar("log_context", default=None)
+_context_factory_lock = threading.Lock()
+_context_factory_installed = threading.Event()
+
+
+def _install_context_factory() -> None:
+    """Install, once, a record factory that attaches the current context data to log records."""
+    with _context_factory_lock:
+        if _context_factory_installed.is_set():
+            return
+        base_factory = logging.getLogRecordFactory()
+
+        def record_factory(*args, **kwargs) -> logging.LogRecord:
+            record = base_factory(*args, **kwargs)
+            context = _CONTEXT.get()
+            if context:
+                record.extra_fields = context
+            return record
+
+        logging.setLogRecordFactory(record_factory)
+        _context_factory_installed.set()
 
 
 class LoggerContext:
-    """Context manager for adding contextual information to logs."""
+    """Context manager for adding contextual information to logs.
+
+    The context is held in a `ContextVar`, so nested contexts stack, and
+    each thread or asyncio task only sees the contexts it entered.
+    """
+
+    __slots__ = ("_token", "context", "logger")
 
     def __init__(self, logger: Logger, context: dict[str, Any]) -> None:
         """Initialize the context manager."""
         self.logger = logger
         self.context = context
-        self.old_factory = None
+        self._token: Token | None = None
+        _install_context_factory()
 
     def __enter__(self) -> "LoggerContext":
         """Enter context and add context data to log records."""
-        self.old_factory = logging.getLogRecordFactory()
-
-        def record_factory(*args, **kwargs) -> logging.LogRecord:
-            record = self.old_factory(*args, **kwargs)
-            if not hasattr(record, "extra_fields"):
-                record.extra_fields = {}
-            record.extra_fields.update(self.context)
-            return record
-
-        logging.setLogRecordFactory(record_factory)
+        self._token = _CONTEXT.set({**(_CONTEXT.get() or {}), **self.context})
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit context and restore original factory."""
-        if self.old_factory:
-            logging.setLogRecordFactory(self.old_factory)
+        """Exit context and restore the enclosing context data."""
+        if self._token is not None:
+            _CONTEXT.reset(self._token)
+            self._token = None
 
 
 # Example usage
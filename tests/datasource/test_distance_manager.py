@@ -1,14 +1,28 @@
+import numpy as np
 import pytest
 
-from src.schemas.node import Node
+from schemas.node import Node
 
 
 @pytest.mark.parametrize(("node_source", "node_target", "expected_distance"), [
-    (Node(id="A", x=0, y=0), Node(id="B", x=3, y=4), 5.0),
-    (Node(id="C", x=1, y=1), Node(id="D", x=4, y=5), 5.0),
+    (Node(id=0, x=0, y=0), Node(id=1, x=3, y=4), 5.0),
+    (Node(id=0, x=1, y=1), Node(id=1, x=4, y=5), 5.0),
+    (Node(id=0, x=0, y=0), Node(id=1, x=5.1, y=0), 5.1),
 ])
 def test_get_distance(node_source: Node, node_target: Node, expected_distance: float):
-    from src.datastore.distance_manager import EuclidianDistanceManager
-    distance_mngr = EuclidianDistanceManager()
+    from datastore.distance_manager import EuclidianDistanceManager
+    from datastore.node_manager import NodeManager
+    distance_mngr = EuclidianDistanceManager(coords=NodeManager.coords_of([node_source, node_target]))
     dist = distance_mngr.get_distance(node_source, node_target)
     assert dist == expected_distance
+
+
+def test_get_distances_many():
+    from datastore.distance_manager import EuclidianDistanceManager
+    from datastore.node_manager import NodeManager
+    nodes = [Node(id=i, x=i * 3.0, y=i * 4.0) for i in range(5)]
+    distance_mngr = EuclidianDistanceManager(coords=NodeManager.coords_of(nodes))
+    target_ids = np.array([4, 1, 3])
+    distances = distance_mngr.get_distances_many(nodes[2], target_ids)
+    assert distances.tolist() == [distance_mngr.get_distance(nodes[2], nodes[i]) for i in target_ids]
+    assert distance_mngr.get_distances_many(nodes[2]).tolist() == [10.0, 5.0, 0.0, 5.0, 10.0]
@@ -0,0 +1,28 @@
+import pytest
+
+from schemas.node import Node
+
+
+@pytest.mark.parametrize(("nodes"), [
+    [Node(id=i, x=i * 1.0, y=i * 1.0) for i in range(10)],
+    [Node(id=i, x=i * 1.0, y=i * 1.0) for i in range(11)],
+])
+def test_valid_edge_matrix(nodes: list[Node]):
+    from datastore.edge_manager import EdgeManager
+    edge_mngr = EdgeManager()
+    for node in nodes:
+        edge_mngr.add_node(node)
+    valid_edges = edge_mngr.valid_edge_matrix()
+    for node_from in nodes:
+        for node_to in nodes:
+            assert valid_edges[node_from.id, node_to.id] == edge_mngr.is_edge_valid(node_from, node_to)
+
+
+def test_neighbors_requires_distance_manager_only_to_sort():
+    from datastore.edge_manager import EdgeManager
+    edge_mngr = EdgeManager()
+    for i in range(4):
+        edge_mngr.add_node(Node(id=i, x=i * 1.0, y=i * 1.0))
+    assert [node.id for node in edge_mngr.neighbors(0)] == [1, 2, 3]
+    with pytest.raises(ValueError, match="distance manager"):
+        edge_mngr.neighbors(0, sort_by_distance=True)
@@ -1,19 +1,24 @@
 import pytest
 
-from src.schemas.node import Node
+from schemas.node import Node
 
 
 @pytest.mark.parametrize(("nodes"), [
     [Node(id=str(i), x=i * 1.0, y=i * 1.0) for i in range(10)],
 ])
 def test_get_closest_k_nodes(nodes: list[Node]):
-    from src.datastore.distance_manager import EuclidianDistanceManager
-    from src.datastore.node_manager import NodeManager
+    from datastore.distance_manager import EuclidianDistanceManager
+    from datastore.node_manager import NodeManager
     node_mngr = NodeManager()
-    distance_mngr = EuclidianDistanceManager()
+    for node in nodes:
+        node_mngr.add_node(node)
+    distance_mngr = EuclidianDistanceManager(coords=node_mngr.coords())
     closest_nodes = node_mngr.get_closest_k_nodes(
         target_node=nodes[0],
         k=5,
         distance_manager=distance_mngr,
     )
     assert len(closest_nodes) == 5
+    assert [node.id for node in closest_nodes] == [1, 2, 3, 4, 5]
+    closest_nodes_by_coords = node_mngr.get_closest_k_nodes(target_node=nodes[0], k=5)
+    assert closest_nodes_by_coords == closest_nodes
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from schemas.node import Node
+
+
+def _make_relocate(nb_of_nodes: int, seed: int):
+    from datastore.distance_manager import EuclidianDistanceManager
+    from datastore.edge_manager import EdgeManager
+    from datastore.node_manager import NodeManager
+    from eval.route_eval import RouteEvaluator
+    from optimiser.iterative.operations.relocate import Relocate
+    from utils.logger import Logger
+    logger = Logger("test_relocate", console_output=False)
+    rng = np.random.default_rng(seed)
+    nodes = [Node(id=i, x=float(x), y=float(y)) for i, (x, y) in enumerate(rng.integers(0, 100, (nb_of_nodes, 2)))]
+    node_mngr = NodeManager(logger=logger)
+    edge_mngr = EdgeManager(logger=logger)
+    for node in nodes:
+        node_mngr.add_node(node)
+        edge_mngr.add_node(node)
+    distance_mngr = EuclidianDistanceManager(coords=node_mngr.coords(), logger=logger)
+    route_eval = RouteEvaluator(node_mngr, edge_mngr, distance_mngr, logger=logger)
+    return Relocate(route_eval, logger=logger), nodes, rng
+
+
+def _brute_force(relocate, route, *, only_valid: bool) -> list[tuple[tuple[int, int, int], float]]:
+    """Score every relocate move of the route by applying it, in `Relocate` move order."""
+    route_eval = relocate.route_eval
+    scored_moves = []
+    route_length = len(route)
+    for v1 in range(1, route_length - 2):
+        for v2 in range(v1, route_length - 2):
+            for insert_pos in range(route_length - (v2 - v1 + 1)):
+                if v1 <= insert_pos <= v2 + 1:
+                    continue
+                new_route = relocate.apply(route, v1=v1, v2=v2, insert_pos=insert_pos)
+                if only_valid and not route_eval.is_valid_route(new_route):
+                    continue
+                scored_moves.append(((v1, v2, insert_pos), route_eval.calculate_objective_value(new_route)))
+    return scored_moves
+
+
+# the shortest relocatable route, and below and above PARALLEL_MIN_ROUTE_LENGTH
+@pytest.mark.parametrize("nb_of_nodes", [4, 6, 12, 40])
+@pytest.mark.parametrize("only_valid", [False, True])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_relocate_kernels_match_brute_force(nb_of_nodes: int, only_valid: bool, seed: int):
+    from eval.route_eval import get_l_value
+    from optimiser.iterative.operations.relocate_kernels import (
+        NO_MOVE,
+        search_best_relocate_parallel_kernel,
+        search_relocate_kernel,
+    )
+    from schemas.route import Route
+    relocate, nodes, rng = _make_relocate(nb_of_nodes, seed)
+    route_eval = relocate.route_eval
+    intermediate_ids = 1 + rng.permutation(nb_of_nodes - 2)
+    if only_valid and nb_of_nodes == 4:
+        intermediate_ids = np.array([2, 1])  # 1 -> 2 is forbidden with n = 2
+    elif only_valid:
+        # odd nodes ending with 1, then even nodes, is valid while 1 < n/2
+        odd_ids = intermediate_ids[(intermediate_ids % 2 == 1) & (intermediate_ids != 1)]
+        even_ids = intermediate_ids[intermediate_ids % 2 == 0]
+        intermediate_ids = np.concatenate((odd_ids, [1], even_ids))
+    ids = np.concatenate(([0], intermediate_ids, [nb_of_nodes - 1]))
+    route = Route(ids=ids, node_table=nodes)
+    assert not only_valid or route_eval.is_valid_route(route)
+    current_value = route_eval.calculate_objective_value(route)
+    scored_moves = _brute_force(relocate, route, only_valid=only_valid)
+    improving_moves = [(move, value) for move, value in scored_moves if value < current_value - 1e-6]
+    best_value = min((value for _, value in improving_moves), default=current_value)
+    best_moves = {move for move, value in improving_moves if value == pytest.approx(best_value)}
+
+    kernel_args = (
+        route.ids,
+        route_eval.distance_manager.distance_matrix,
+        route_eval.valid_transition_matrix(),
+        get_l_value(route_eval.node_manager, route_eval.distance_manager),
+        only_valid,
+    )
+
+    sequential = search_relocate_kernel(*kernel_args, False)
+    parallel = search_best_relocate_parallel_kernel(*kernel_args)
+    for v1, v2, insert_pos, value, _ in (sequential, parallel):
+        assert value == pytest.approx(best_value)
+        if not improving_moves:
+            assert (v1, v2, insert_pos) == (NO_MOVE, NO_MOVE, NO_MOVE)
+            continue
+        assert (v1, v2, insert_pos) in best_moves
+        new_route = relocate.apply(route, v1=v1, v2=v2, insert_pos=insert_pos)
+        assert route_eval.calculate_objective_value(new_route) == pytest.approx(value)
+
+    v1, v2, insert_pos, value, _ = search_relocate_kernel(*kernel_args, True)
+    if improving_moves:
+        first_move, first_value = improving_moves[0]
+        assert (v1, v2, insert_pos) == first_move
+        assert value == pytest.approx(first_value)
+    else:
+        assert (v1, v2, insert_pos) == (NO_MOVE, NO_MOVE, NO_MOVE)
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pytest
+
+from utils.logger import Logger
+
+
+def test_close_of_reusing_logger_keeps_owner_output(tmp_path: Path):
+    filepath = tmp_path / "shared.log"
+    owner = Logger("test_shared", console_output=False, file_output=str(filepath))
+    reuser = Logger("test_shared", console_output=False, file_output=str(filepath))
+    reuser.close()
+    owner.info("after reuser closed")
+    owner.close()
+    assert "after reuser closed" in filepath.read_text(encoding="utf-8")
+
+
+def _read_json_lines(filepath: Path) -> list[dict]:
+    import json
+    return [json.loads(line) for line in filepath.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_rollover_at_max_bytes(tmp_path: Path, buffered: bool):
+    import logging
+
+    from utils.logger import FastRotatingFileHandler
+    filepath = tmp_path / "rotating.log"
+    handler = FastRotatingFileHandler(
+        str(filepath), maxBytes=100, backupCount=2, encoding="utf-8", buffered=buffered,
+    )
+    for i in range(10):
+        handler.emit(logging.makeLogRecord({"msg": f"record {i} " + "x" * 20}))  # 30 bytes a line
+        handler.flush()
+        assert handler._bytes_written == filepath.stat().st_size
+    handler.close()
+    # 3 lines (90 bytes) per file, the 4th would reach maxBytes
+    assert filepath.read_text(encoding="utf-8").splitlines()[0].startswith("record 9 ")
+    backup_1 = Path(f"{filepath}.1").read_text(encoding="utf-8").splitlines()
+    assert [line.split()[1] for line in backup_1] == ["6", "7", "8"]
+    assert Path(f"{filepath}.2").stat().st_size == 90
+    assert not Path(f"{filepath}.3").exists()
+
+
+def test_queued_records_written_on_close(tmp_path: Path):
+    filepath = tmp_path / "queued.log"
+    logger = Logger("test_queued", console_output=False, file_output=str(filepath), json_format=True)
+    for i in range(5000):
+        logger.info(f"record {i}")
+    logger.close()
+    assert [record["message"] for record in _read_json_lines(filepath)] == [f"record {i}" for i in range(5000)]
+
+
+@pytest.mark.parametrize(("msg", "args"), [
+    ("plain", None),
+    ('quotes " and \\ backslash', None),
+    ("non-ASCII é ü 日本", None),
+    ("%s of %d%%", ("args", 100)),
+])
+def test_json_template_matches_dict_path(msg: str, args: tuple | None):
+    import logging
+
+    from utils.logger import DEFAULT_DATE_FORMAT, JsonFormatter
+    formatter = JsonFormatter(DEFAULT_DATE_FORMAT)
+    record = logging.LogRecord("test.json", logging.INFO, "path/module.py", 7, msg, args, None, func="fn")
+    template_output = formatter.format(record)
+    # a record with extra fields goes through the dict path, which appends them last
+    record.extra_fields = {"extra": 1}
+    assert formatter.format(record) == template_output[:-1] + ',"extra":1}'
+
+
+def test_nested_contexts_unwind(tmp_path: Path):
+    filepath = tmp_path / "context.log"
+    logger = Logger("test_context", console_output=False, file_output=str(filepath), json_format=True)
+    with logger.add_context(outer=1):
+        with logger.add_context(inner=2, outer=3):
+            logger.info("inner")
+        logger.info("outer")
+    logger.info("none")
+    logger.close()
+    records = _read_json_lines(filepath)
+    assert records[0]["outer"] == 3
+    assert records[0]["inner"] == 2
+    assert records[1]["outer"] == 1
+    assert "inner" not in records[1]
+    assert "outer" not in records[2]
+
+
+def test_exception_survives_queue(tmp_path: Path):
+    filepath = tmp_path / "exception.log"
+    logger = Logger("test_exception", console_output=False, file_output=str(filepath), json_format=True)
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("failed division")
+    logger.close()
+    (record,) = _read_json_lines(filepath)
+    assert record["message"] == "failed division"
+    assert "ZeroDivisionError: division by zero" in record["exception"]